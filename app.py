@@ -1,10 +1,12 @@
 # Main Window - Application window and controller
 
 import sys
-import io
 import os
+import threading
+import collections
 import traceback
 import datetime
+import functools
 import vanilla
 import AppKit
 import drawBot as db
@@ -32,16 +34,16 @@ from config import (
     get_proof_by_settings_key,
 )
 from fonts import FontManager
-from fonts import product_dict, variableFont, pairStaticStyles
-from fonts import filteredCharset
+from fonts import variableFont, pairStaticStyles
+from fonts import get_font_meta, get_axes_product
 from settings import validate_setting_value, safe_execute
 from ui import (
     StepperList2Cell,
+    DeferredCallTarget,
     get_stepper_config_for_setting,
     register_row_setting,
     clear_row_settings,
 )
-from fonts import categorize
 from proof import charsetProof, spacingProof
 from proof import (
     ProofContext,
@@ -54,6 +56,7 @@ from settings import (
     ProofSettingsManager,
     get_app_settings,
     make_settings_key,
+    make_feature_key,
     create_unique_proof_key,
 )
 from ui import FilesTab
@@ -65,9 +68,12 @@ def close_existing_windows(window_title):
     try:
         app = AppKit.NSApp()
         if app is not None and hasattr(app, "windows"):
-            for window in app.windows():
-                if window.title() == window_title:
-                    window.close()
+            # Filter natively instead of bridging title() for every window
+            predicate = AppKit.NSPredicate.predicateWithFormat_argumentArray_(
+                "title == %@", [window_title]
+            )
+            for window in app.windows().filteredArrayUsingPredicate_(predicate):
+                window.close()
     except (ImportError, AttributeError):
         pass
 
@@ -75,15 +81,40 @@ def close_existing_windows(window_title):
 class TextBoxOutput:
     """Redirect stdout/stderr to a text box."""
 
+    __slots__ = ("textBox", "_contents", "_length", "_truncated")
+
+    # Only the most recent output is kept so a runaway log cannot bloat the view
+    MAX_CHARS = 65536
+    TRUNCATED_MARKER = "…[truncated]…\n"
+
     def __init__(self, textBox):
         self.textBox = textBox
+        # Python-side copy of the text box contents, so writes never have to
+        # read the whole string back from the view
+        self._contents = collections.deque()
+        self._length = 0
+        self._truncated = False
 
     def write(self, text):
         """Write text to the text box."""
+        if not AppKit.NSThread.isMainThread():
+            # Proof rendering prints from a worker thread; AppKit views may
+            # only be touched on the main thread
+            callAfter(self.write, text)
+            return
         if hasattr(self.textBox, "set"):
-            current_text = self.textBox.get()
-            new_text = current_text + text
-            self.textBox.set(new_text)
+            self._contents.append(text)
+            self._length += len(text)
+
+            # Drop the oldest chunks once over capacity, keeping the newest one
+            while self._length > self.MAX_CHARS and len(self._contents) > 1:
+                self._length -= len(self._contents.popleft())
+                self._truncated = True
+
+            text_out = "".join(self._contents)
+            if self._truncated:
+                text_out = self.TRUNCATED_MARKER + text_out
+            self.textBox.set(text_out)
 
     def flush(self):
         """Flush method for compatibility."""
@@ -104,8 +135,9 @@ class ProofWindow:
 
     def _refresh_ui_components(self):
         """Refresh all UI components after settings changes."""
-        self.controlsTab.refresh_proof_options_list()
-        self.refresh_controls_tab()
+        if self._controlsTab is not None:
+            self._controlsTab.refresh_proof_options_list()
+            self.refresh_controls_tab()
 
     def _handle_settings_confirmation(self, message_text, action_func):
         """Handle confirmation dialogs for settings operations."""
@@ -117,18 +149,29 @@ class ProofWindow:
     def _validate_and_update_settings(
         self, items, key_field="_key", value_field="Value"
     ):
-        """Validate and update settings from list items."""
+        """Validate and update settings from list items carrying key_field."""
         for item in items:
-            if key_field in item:
-                key = item[key_field]
-                value = item[value_field]
-                is_valid, converted_value, error_msg = validate_setting_value(
-                    key, value
-                )
-                if not is_valid:
-                    print(f"Invalid value for {item.get('Setting', key)}: {error_msg}")
-                    continue
-                self.proof_settings[key] = converted_value
+            key = item[key_field]
+            value = item[value_field]
+            is_valid, converted_value, error_msg = validate_setting_value(key, value)
+            if not is_valid:
+                print(f"Invalid value for {item.get('Setting', key)}: {error_msg}")
+                continue
+            self.proof_settings[key] = converted_value
+
+    def _set_keyed_items(self, list_view, items):
+        """Set list items and remember which rows carry a settings key."""
+        self._keyed_rows[id(list_view)] = tuple(
+            row_index for row_index, item in enumerate(items) if "_key" in item
+        )
+        list_view.set(items)
+
+    def _keyed_items(self, list_view, items):
+        """Return the items whose rows were recorded as carrying a settings key."""
+        rows = self._keyed_rows.get(id(list_view))
+        if rows is None:
+            return [item for item in items if "_key" in item]
+        return [items[row_index] for row_index in rows]
 
     def __init__(self):
         # Close any existing windows with the same title
@@ -154,6 +197,22 @@ class ProofWindow:
         ]
         self.default_on_features = DEFAULT_ON_FEATURES
         self.proof_settings = self.proof_settings_manager.proof_settings
+
+        # Controls tab is built lazily on first switch to it
+        self._controlsTab = None
+        # Set while a proof is rendering on the background thread
+        self._generating = False
+        # Last popover feature list and the key it was built for
+        self._last_features_key = None
+        self._last_features_value = None
+        # Proof settings popover and the proof instance it is editing
+        self.proof_settings_popover = None
+        self.current_proof_key = None
+        self.current_base_proof_type = None
+        # Row indices carrying a settings key, per popover list
+        self._keyed_rows = {}
+        # Coalesces stepper configuration to one pass per run loop turn
+        self._stepper_configure_call = DeferredCallTarget.alloc().init()
         self.initialize_proof_settings()
 
         # Create main window
@@ -175,23 +234,13 @@ class ProofWindow:
             callback=self.switchTab,
         )
 
-        # Create tab instances
+        # Create the initially visible tab; Controls is deferred to switchTab
         self.filesTab = FilesTab(self, self.font_manager)
-        self.controlsTab = ControlsTab(self, self.settings)
-
-        # Refresh proof options list after tabs are created
-        if hasattr(self, "controlsTab") and self.controlsTab:
-            self.controlsTab.refresh_proof_options_list()
 
         # --- Main Content Group (holds the two tab groups) ---
         self.mainContent = vanilla.Group((0, 44, -0, -0))
         self.mainContent.filesGroup = self.filesTab.group
-        self.mainContent.controlsGroup = self.controlsTab.group
         self.filesTab.group.show(True)
-        self.controlsTab.group.show(False)
-
-        # Integrate preview into controls tab
-        self.controlsTab.integrate_preview_view(self.pdf_manager.get_preview_view())
 
         # --- Debug Text Editor ---
         self.debugTextEditor = vanilla.TextEditor(
@@ -211,25 +260,44 @@ class ProofWindow:
         )
         self.w.tabSwitcher = self.tabSwitcher
 
-        # Show only the selected group
-        self.switchTab(self.tabSwitcher)
-
         # Redirect stdout and stderr to the debugTextEditor
         self._original_stdout = sys.stdout
         self._original_stderr = sys.stderr
-        sys.stdout = TextBoxOutput(self.debugTextEditor)
-        sys.stderr = TextBoxOutput(self.debugTextEditor)
+        # Both streams share one writer so its copy of the contents stays whole
+        sys.stdout = sys.stderr = TextBoxOutput(self.debugTextEditor)
 
         self.w.open()
         # Ensure Files tab is selected by default on startup
         self.tabSwitcher.set(0)
         self.switchTab(self.tabSwitcher)
 
+    @property
+    def controlsTab(self):
+        """The Controls tab, constructed on first access."""
+        return self.get_controls_tab()
+
+    def get_controls_tab(self):
+        """Build the Controls tab on first use and return it."""
+        if self._controlsTab is None:
+            controls_tab = ControlsTab(self, self.settings)
+            controls_tab.refresh_proof_options_list()
+
+            # Integrate preview into controls tab
+            controls_tab.integrate_preview_view(self.pdf_manager.get_preview_view())
+
+            self.mainContent.controlsGroup = controls_tab.group
+            controls_tab.group.show(False)
+            self._controlsTab = controls_tab
+        return self._controlsTab
+
     def switchTab(self, sender):
         """Switch between tabs."""
         idx = sender.get()
+        if idx == 1:
+            self.get_controls_tab()
         self.filesTab.group.show(idx == 0)
-        self.controlsTab.group.show(idx == 1)
+        if self._controlsTab is not None:
+            self._controlsTab.group.show(idx == 1)
 
     def _setup_category_controls(self, popover, proof_key, show=True):
         """Setup character category controls for popover."""
@@ -255,9 +323,37 @@ class ProofWindow:
                 )
                 control.set(value)
 
-    def _build_feature_settings(self, proof_key, feature_tags):
-        """Build feature settings list for a given proof and feature tags."""
-        return self.proof_settings_manager.get_opentype_features_for_proof(proof_key)
+    def _feature_settings_key(self, proof_key, feature_tags):
+        """Identify a feature list by proof, font features and their values."""
+        return (
+            proof_key,
+            feature_tags,
+            tuple(
+                self.proof_settings.get(make_feature_key(proof_key, tag))
+                for tag in feature_tags
+            ),
+        )
+
+    def _build_feature_settings(self, proof_key):
+        """Build feature settings list for a proof, reusing the last unchanged one."""
+        manager = self.proof_settings_manager
+        feature_tags = tuple(manager._get_font_features())
+        cache_key = self._feature_settings_key(proof_key, feature_tags)
+        if cache_key != self._last_features_key:
+            self._last_features_value = manager.get_opentype_features_for_proof(
+                proof_key
+            )
+            # Keyed after building: the spacing proof forces its kern value
+            self._last_features_key = self._feature_settings_key(
+                proof_key, feature_tags
+            )
+        # List2 may mutate its rows, so hand out copies
+        return [dict(item) for item in self._last_features_value]
+
+    def _invalidate_feature_settings(self):
+        """Drop the cached popover feature list."""
+        self._last_features_key = None
+        self._last_features_value = None
 
     def save_all_settings(self):
         """Save all current settings to the settings file."""
@@ -270,10 +366,13 @@ class ProofWindow:
 
     def resetSettingsCallback(self, sender):
         """Handle the Reset Settings button click."""
+        if self.block_while_generating("resetting settings"):
+            return
 
         def _reset_action():
             # Reset settings to defaults (this also clears user_settings_file)
-            self.settings.reset_to_defaults()
+            # Saving is deferred until the proof options are overridden below
+            self.settings.reset_to_defaults(auto_save=False)
 
             # Override proof options to all be False (unchecked)
             # Use the centralized mapping to get all proof keys
@@ -282,8 +381,9 @@ class ProofWindow:
             proof_option_keys = ["show_baselines"] + list(
                 get_proof_settings_mapping().values()
             )
-            for option_key in proof_option_keys:
-                self.settings.set_proof_option(option_key, False)
+            self.settings.update_proof_options(
+                {option_key: False for option_key in proof_option_keys}
+            )
 
             # Clear font manager
             self.font_manager.fonts = tuple()
@@ -360,49 +460,87 @@ class ProofWindow:
 
     def generateCallback(self, sender):
         """Handle the Generate Proof button click."""
+        if self._generating:
+            print("Proof generation already in progress.")
+            return
 
         def _generate_operation():
             # Save all current settings before generating
             self.save_all_settings()
 
-            # Setup stdout/stderr redirection
-            buffer = io.StringIO()
-            old_stdout, old_stderr = sys.stdout, sys.stderr
-            sys.stdout = sys.stderr = buffer
+            job = self._prepare_proof_generation()
+            if job is None:
+                return
 
-            try:
-                setup_result = self._setup_proof_generation(self.controlsTab.group)
-                if setup_result[0] is None:  # Check if setup failed
-                    return
+            # Render off the main thread so the window stays responsive;
+            # output keeps streaming through TextBoxOutput meanwhile
+            self._generating = True
+            threading.Thread(
+                target=self._render_proof_generation, args=(job,), daemon=True
+            ).start()
 
-                fonts, userAxesValues, proof_options, proof_options_items = setup_result
-                otfeatures_by_proof, cols_by_proof, paras_by_proof = (
-                    self._build_proof_settings(proof_options_items)
-                )
+        self._safe_callback("generateCallback", _generate_operation)
 
-                # Generate and display proof
-                output_path = self.run_proof(
-                    userAxesValues,
-                    proof_options,
-                    otfeatures_by_proof,
-                    cols_by_proof=cols_by_proof,
-                    paras_by_proof=paras_by_proof,
-                )
-                if self.display_pdf(output_path):
-                    self.tabSwitcher.set(
-                        1
-                    )  # Switch to Controls tab (which now has preview)
-                    self.switchTab(self.tabSwitcher)
-
-            except Exception as e:
-                print(f"Error in proof generation: {e}")
-                traceback.print_exc()
-            finally:
-                # Restore stdout/stderr and update debug output
-                sys.stdout, sys.stderr = old_stdout, old_stderr
-                self.debugTextEditor.set(buffer.getvalue())
+    def _prepare_proof_generation(self):
+        """Read settings and UI state for a proof run (main thread)."""
+        try:
+            setup_result = self._setup_proof_generation(self.controlsTab.group)
+            if setup_result[0] is None:  # Check if setup failed
+                return None
 
-        self._safe_callback("generateCallback", _generate_operation)
+            fonts, userAxesValues, proof_options, proof_options_items = setup_result
+            otfeatures_by_proof, cols_by_proof, paras_by_proof = (
+                self._build_proof_settings(proof_options_items)
+            )
+            # Snapshot everything the render reads, so main thread edits made
+            # meanwhile only apply to the next run. Axis edits replace a font's
+            # dict rather than mutating it, and setting values are scalars.
+            fonts = tuple(fonts)
+            get_axis_values = self.font_manager.get_axis_values_for_font
+            return dict(
+                fonts=fonts,
+                axes_by_font={font: get_axis_values(font) for font in fonts},
+                proof_settings=dict(self.proof_settings),
+                userAxesValues=userAxesValues,
+                proof_options=proof_options,
+                otfeatures_by_proof=otfeatures_by_proof,
+                cols_by_proof=cols_by_proof,
+                paras_by_proof=paras_by_proof,
+                proof_options_items=proof_options_items,
+            )
+        except Exception as e:
+            print(f"Error in proof generation: {e}")
+            traceback.print_exc()
+            return None
+
+    def _render_proof_generation(self, job):
+        """Render the proof PDF (background thread)."""
+        output_path = None
+        try:
+            output_path = self.run_proof(**job)
+        except Exception as e:
+            print(f"Error in proof generation: {e}")
+            traceback.print_exc()
+        finally:
+            callAfter(self._finish_proof_generation, output_path)
+
+    def block_while_generating(self, action):
+        """Return True, and say so, if a proof is rendering in the background."""
+        if self._generating:
+            print(f"Proof generation in progress; {action} is unavailable.")
+        return self._generating
+
+    def _finish_proof_generation(self, output_path):
+        """Display the rendered proof (main thread)."""
+        self._generating = False
+        try:
+            if output_path and self.display_pdf(output_path):
+                # Switch to Controls tab (which now has preview)
+                self.tabSwitcher.set(1)
+                self.switchTab(self.tabSwitcher)
+        except Exception as e:
+            print(f"Error displaying proof: {e}")
+            traceback.print_exc()
 
     def _setup_proof_generation(self, controls):
         """Setup variables for proof generation."""
@@ -432,6 +570,7 @@ class ProofWindow:
         """Initialize proof-specific settings storage using the settings manager."""
         # Clear handler cache when settings change
         clear_handler_cache()
+        self._invalidate_feature_settings()
 
         # Delegate to the proof settings manager
         self.proof_settings_manager.initialize_proof_settings()
@@ -440,8 +579,8 @@ class ProofWindow:
         self.proof_settings = self.proof_settings_manager.proof_settings
 
         # Refresh proof options list to show/hide Arabic proofs based on loaded fonts
-        if hasattr(self, "controlsTab") and self.controlsTab:
-            self.controlsTab.refresh_proof_options_list()
+        if self._controlsTab is not None:
+            self._controlsTab.refresh_proof_options_list()
 
     def create_proof_settings_popover(self):
         """Create the proof settings popover."""
@@ -564,7 +703,7 @@ class ProofWindow:
 
     def proofTypeSelectionCallback(self, sender):
         """Handle proof type selection in popover."""
-        if not hasattr(self, "proof_settings_popover"):
+        if self.proof_settings_popover is None:
             return
 
         idx = sender.get()
@@ -578,22 +717,11 @@ class ProofWindow:
         numeric_items = self.proof_settings_manager.get_popover_settings_for_proof(
             proof_key
         )
-        popover.numericList.set(numeric_items)
-
-        # Populate the row setting registry for stepper auto-configuration
-        clear_row_settings()
-        for row_index, item in enumerate(numeric_items):
-            if "Setting" in item:
-                register_row_setting(row_index, item["Setting"])
-
-        # Configure steppers for the numeric settings
-        self.configureSteppersForNumericList(popover.numericList, numeric_items)
+        self._populate_numeric_list(popover.numericList, numeric_items)
 
         # Update features settings using settings manager
-        feature_items = self.proof_settings_manager.get_opentype_features_for_proof(
-            proof_key
-        )
-        popover.featuresList.set(feature_items)
+        feature_items = self._build_feature_settings(proof_key)
+        self._set_keyed_items(popover.featuresList, feature_items)
 
         # Update alignment control for supported proof types
         if proof_supports_formatting(proof_key):
@@ -621,9 +749,7 @@ class ProofWindow:
 
     def characterCategoryCallback(self, sender):
         """Handle character category checkbox changes."""
-        if not hasattr(self, "current_proof_key") or not hasattr(
-            self, "current_base_proof_type"
-        ):
+        if self.current_proof_key is None or self.current_base_proof_type is None:
             return
 
         # Only handle this for Filtered Character Set and Spacing Proof
@@ -651,7 +777,7 @@ class ProofWindow:
 
     def alignPopUpCallback(self, sender):
         """Handle alignment selection changes."""
-        if not hasattr(self, "current_proof_key"):
+        if self.current_proof_key is None:
             return
 
         selected_idx = sender.get()
@@ -670,6 +796,24 @@ class ProofWindow:
             return
         self.proof_settings[setting_key] = converted_value
 
+    def _populate_numeric_list(self, numeric_list, numeric_items):
+        """Fill the numeric settings list with one set() and one stepper pass."""
+        # Register row settings before the reload so stepper cells can
+        # configure themselves while the table populates
+        clear_row_settings()
+        needs_steppers = False
+        for row_index, item in enumerate(numeric_items):
+            if "Setting" in item:
+                register_row_setting(row_index, item["Setting"])
+                needs_steppers = True
+
+        self._set_keyed_items(numeric_list, numeric_items)
+
+        # Configure steppers once, after the table's reload; nothing to do
+        # when no row carries a stepper setting
+        if needs_steppers:
+            self.configureSteppersForNumericList(numeric_list, numeric_items)
+
     def configureSteppersForNumericList(self, numeric_list, items):
         """Configure stepper cells in the numeric list with appropriate min/max/increment values."""
 
@@ -677,78 +821,84 @@ class ProofWindow:
             table_view = numeric_list.getNSTableView()
             data_source = table_view.dataSource()
 
+            # Loop-invariant lookups resolved once for all rows
+            cell_wrappers = getattr(data_source, "_cellWrappers", None)
+            view_at = getattr(table_view, "viewAtColumn_row_", None)
+            get_config = get_stepper_config_for_setting
+            change_callback = self.stepperChangeCallback
+
             for row_index, item in enumerate(items):
                 if "Setting" not in item:
                     continue
 
-                setting_name = item["Setting"]
-                stepper_config = get_stepper_config_for_setting(setting_name)
+                stepper_config = get_config(item["Setting"])
 
                 # Get the NSView for the "Value" column (column index 1)
                 try:
-                    ns_cell_view = table_view.viewAtColumn_row_(
-                        1, row_index, makeIfNecessary=True
-                    )
-                except AttributeError:
-                    try:
+                    if view_at is not None:
+                        ns_cell_view = view_at(1, row_index, makeIfNecessary=True)
+                    else:
                         ns_cell_view = table_view.makeViewWithIdentifier_owner_(
                             "Value", data_source
                         )
-                    except:
-                        continue
+                except AttributeError:
+                    continue
+                if not ns_cell_view:
+                    continue
 
                 # Find the vanilla wrapper through multiple approaches
                 vanilla_wrapper = None
-                if ns_cell_view and hasattr(data_source, "_cellWrappers"):
-                    vanilla_wrapper = data_source._cellWrappers.get(ns_cell_view)
-
-                if (
-                    not vanilla_wrapper
-                    and ns_cell_view
-                    and hasattr(ns_cell_view, "vanillaWrapper")
-                ):
-                    try:
-                        vanilla_wrapper = ns_cell_view.vanillaWrapper()
-                    except:
-                        pass
+                if cell_wrappers is not None:
+                    vanilla_wrapper = cell_wrappers.get(ns_cell_view)
+
+                if not vanilla_wrapper:
+                    wrapper_getter = getattr(ns_cell_view, "vanillaWrapper", None)
+                    if wrapper_getter is not None:
+                        vanilla_wrapper = wrapper_getter()
 
-                if not vanilla_wrapper and hasattr(
-                    ns_cell_view, "setStepperConfiguration_"
-                ):
+                if not vanilla_wrapper:
                     vanilla_wrapper = ns_cell_view
 
-                if vanilla_wrapper and hasattr(
-                    vanilla_wrapper, "setStepperConfiguration_"
-                ):
-                    vanilla_wrapper.setStepperConfiguration_(stepper_config)
+                config_setter = getattr(
+                    vanilla_wrapper, "setStepperConfiguration_", None
+                )
+                if config_setter is not None:
+                    config_setter(stepper_config)
                     if "_key" in item:
                         vanilla_wrapper.setChangeCallback_withKey_(
-                            self.stepperChangeCallback, item["_key"]
+                            change_callback, item["_key"]
                         )
 
-        callAfter(configure_delayed)
+        # Replaces any pass still pending for an older list
+        self._stepper_configure_call.schedule(configure_delayed)
 
     def numericSettingsEditCallback(self, sender):
         """Handle edits to numeric settings in popover."""
-        self._validate_and_update_settings(sender.get(), value_field="Value")
+        items = self._keyed_items(sender, sender.get())
+        self._validate_and_update_settings(items, value_field="Value")
 
     def featuresEditCallback(self, sender):
         """Handle edits to OpenType features in popover."""
+        self._invalidate_feature_settings()
         items = sender.get()
-        for item in items:
-            if "_key" in item:
-                key = item["_key"]
-                enabled = item["Enabled"]
-
-                # Prevent editing kern feature for SpacingProof
-                if item.get("_readonly", False):
-                    # Reset to disabled if someone tries to change it
-                    if enabled:
-                        item["Enabled"] = False
-                        sender.set(items)
-                    continue
+        needs_reset = False
+        for item in self._keyed_items(sender, items):
+            key = item["_key"]
+            enabled = item["Enabled"]
+
+            # Prevent editing kern feature for SpacingProof
+            if item.get("_readonly", False):
+                # Reset to disabled if someone tries to change it
+                if enabled:
+                    item["Enabled"] = False
+                    needs_reset = True
+                continue
 
-                self.proof_settings[key] = bool(enabled)
+            self.proof_settings[key] = bool(enabled)
+
+        # Reload the table once, after all readonly rows have been reset
+        if needs_reset:
+            sender.set(items)
 
     def run_proof(
         self,
@@ -759,29 +909,50 @@ class ProofWindow:
         nowformat=None,
         cols_by_proof=None,
         paras_by_proof=None,
+        proof_options_items=None,
+        fonts=None,
+        axes_by_font=None,
+        proof_settings=None,
     ):
-        """Run the proof generation process."""
+        """Run the proof generation process.
+
+        May run off the main thread; pass proof_options_items, fonts,
+        axes_by_font and proof_settings snapshotted on the main thread so
+        nothing the UI can change is read while rendering.
+        """
+        # Dynamic proof generation based on UI list order
+        # Get the current proof options from the UI in their display order
+        if proof_options_items is None:
+            controls = self.controlsTab
+            if not (
+                hasattr(controls, "group")
+                and hasattr(controls.group, "proofOptionsList")
+            ):
+                print("Error: Could not access proof options list")
+                return None
+
+            proof_options_items = controls.group.proofOptionsList.get()
+
         # Initialize PDF generation
         if not self.pdf_manager.begin_pdf_generation():
             print("Error: Failed to initialize PDF generation")
             return None
 
-        pairedStaticStyles = pairStaticStyles(self.font_manager.fonts)
+        if fonts is None:
+            fonts = self.font_manager.fonts
+        if axes_by_font is None:
+            get_axis_values = self.font_manager.get_axis_values_for_font
+            axes_by_font = {font: get_axis_values(font) for font in fonts}
+        if proof_settings is None:
+            proof_settings = self.proof_settings
+
+        pairedStaticStyles = pairStaticStyles(fonts)
         if otfeatures_by_proof is None:
             otfeatures_by_proof = {}
         if cols_by_proof is None:
             cols_by_proof = {}
         if paras_by_proof is None:
             paras_by_proof = {}
-        feature_tags = (
-            db.listOpenTypeFeatures(self.font_manager.fonts[0])
-            if self.font_manager.fonts
-            else []
-        )
-        # Create default OpenType features dict
-        default_otfeatures = {tag: tag in DEFAULT_ON_FEATURES for tag in feature_tags}
-        spacing_otfeatures = dict(default_otfeatures)
-        spacing_otfeatures["kern"] = False
 
         # Initialize now and nowformat if not provided
         if now is None:
@@ -789,64 +960,61 @@ class ProofWindow:
         if nowformat is None:
             nowformat = now.strftime("%Y-%m-%d_%H%M")
 
-        for indFont in self.font_manager.fonts:
-            fullCharacterSet = filteredCharset(indFont)
-            cat = categorize(fullCharacterSet)
-            variableDict = db.listFontVariations(indFont)
+        # Create the context once; per-font fields are updated in the loop
+        proof_context = ProofContext(
+            full_character_set="",
+            axes_product=None,
+            ind_font=None,
+            paired_static_styles=pairedStaticStyles,
+            otfeatures_by_proof=otfeatures_by_proof,
+            cols_by_proof=cols_by_proof,
+            paras_by_proof=paras_by_proof,
+            cat={},
+            proof_name=None,  # Will be updated per proof
+        )
+
+        # Bind loop-invariant lookups once for the per-proof loop below;
+        # font sizes come from the same settings the handlers read
+        get_font_size = functools.partial(
+            self.proof_settings_manager.get_proof_font_size,
+            proof_settings=proof_settings,
+        )
+
+        # Resolve the enabled proofs and their base types once for all fonts
+        enabled_proofs = [
+            (item["Option"], item.get("_original_option", item["Option"]))
+            for item in proof_options_items
+            if item.get("Enabled")
+        ]
+
+        for indFont in fonts:
+            fullCharacterSet, cat, variableDict, _ = get_font_meta(indFont)
 
             # Prefer per-font axes from Files tab if present
-            axes_dict = self.font_manager.get_axis_values_for_font(indFont)
+            axes_dict = axes_by_font.get(indFont)
             if axes_dict:
-                axesProduct = list(product_dict(**axes_dict))
+                axesProduct = get_axes_product(axes_dict)
             elif userAxesValues:
-                axesProduct = list(product_dict(**userAxesValues))
+                axesProduct = get_axes_product(userAxesValues)
             elif not bool(variableDict):
                 axesProduct = ""
             else:
                 axesProduct = variableFont(indFont)[0]
 
-            # Dynamic proof generation based on UI list order
-            # Get the current proof options from the UI in their display order
-            controls = self.controlsTab
-            if not (
-                hasattr(controls, "group")
-                and hasattr(controls.group, "proofOptionsList")
-            ):
-                print("Error: Could not access proof options list")
-                return None
-
-            proof_options_items = controls.group.proofOptionsList.get()
-
-            # Pre-create context once for efficiency
-            proof_context = ProofContext(
-                full_character_set=fullCharacterSet,
-                axes_product=axesProduct,
-                ind_font=indFont,
-                paired_static_styles=pairedStaticStyles,
-                otfeatures_by_proof=otfeatures_by_proof,
-                cols_by_proof=cols_by_proof,
-                paras_by_proof=paras_by_proof,
-                cat=cat,
-                proof_name=None,  # Will be updated per proof
-            )
+            # Update the shared context with this font's data
+            proof_context.full_character_set = fullCharacterSet
+            proof_context.axes_product = axesProduct
+            proof_context.ind_font = indFont
+            proof_context.cat = cat
 
             # Generate each enabled proof using the optimized handler system
-            for item in proof_options_items:
-                if not item["Enabled"]:
-                    continue
-
-                proof_name = item["Option"]
-                base_proof_type = item.get("_original_option", proof_name)
-
+            for proof_name, base_proof_type in enabled_proofs:
                 # Update context for this specific proof
                 proof_context.proof_name = proof_name
 
                 # Get handler and generate proof
                 handler = get_proof_handler(
-                    base_proof_type,
-                    proof_name,
-                    self.proof_settings,
-                    self.proof_settings_manager.get_proof_font_size,
+                    base_proof_type, proof_name, proof_settings, get_font_size
                 )
 
                 if handler:
@@ -862,12 +1030,14 @@ class ProofWindow:
                     )
 
         # Finalize PDF generation and save
-        pdf_path = self.pdf_manager.end_pdf_generation(self.font_manager, now)
+        pdf_path = self.pdf_manager.end_pdf_generation(fonts, now)
         print(datetime.datetime.now() - now)
         return pdf_path
 
     def addSettingsFileCallback(self, sender):
         """Handle the Add Settings File button click."""
+        if self.block_while_generating("loading a settings file"):
+            return
         try:
             result = getFile(
                 title="Select Settings File",
@@ -922,6 +1092,9 @@ class ProofWindow:
 
     def refresh_controls_tab(self):
         """Refresh the controls tab with current settings values."""
+        if self._controlsTab is None:
+            # Not built yet; it reads current settings when first created
+            return
         try:
             self.controlsTab.refresh_proof_options_list()
             if hasattr(self.controlsTab.group, "pageFormatPopUp"):
@@ -974,22 +1147,11 @@ class ProofWindow:
                     unique_proof_key, base_proof_key
                 )
             )
-            popover.numericList.set(numeric_items)
-
-            # Populate the row setting registry for stepper auto-configuration
-            clear_row_settings()
-            for row_index, item in enumerate(numeric_items):
-                if "Setting" in item:
-                    register_row_setting(row_index, item["Setting"])
-
-            # Configure steppers for the numeric settings
-            self.configureSteppersForNumericList(popover.numericList, numeric_items)
+            self._populate_numeric_list(popover.numericList, numeric_items)
 
             # Update OpenType features for this specific instance using settings manager
-            feature_items = self.proof_settings_manager.get_opentype_features_for_proof(
-                unique_proof_key
-            )
-            popover.featuresList.set(feature_items)
+            feature_items = self._build_feature_settings(unique_proof_key)
+            self._set_keyed_items(popover.featuresList, feature_items)
 
             # Update alignment control for supported proof types
             if proof_supports_formatting(base_proof_key):
@@ -3,6 +3,8 @@
 
 import os
 import sys
+from functools import cache
+from types import MappingProxyType
 
 # =============================================================================
 # Application Configuration
@@ -106,34 +108,38 @@ FOOTER_FEATURES_FONT_SIZE = 7
 # =============================================================================
 
 # Default OpenType features that are typically enabled
-DEFAULT_ON_FEATURES = {
-    "ccmp",
-    "kern",
-    "calt",
-    "rlig",
-    "liga",
-    "mark",
-    "mkmk",
-    "clig",
-    "dist",
-    "rclt",
-    "rvrn",
-    "curs",
-    "locl",
-}
-
-HIDDEN_FEATURES = {
-    "init",
-    "medi",
-    "med2",
-    "fina",
-    "fin2",
-    "fin3",
-    "isol",
-    "curs",
-    "aalt",
-    "rand",
-}
+DEFAULT_ON_FEATURES = frozenset(
+    {
+        "ccmp",
+        "kern",
+        "calt",
+        "rlig",
+        "liga",
+        "mark",
+        "mkmk",
+        "clig",
+        "dist",
+        "rclt",
+        "rvrn",
+        "curs",
+        "locl",
+    }
+)
+
+HIDDEN_FEATURES = frozenset(
+    {
+        "init",
+        "medi",
+        "med2",
+        "fina",
+        "fin2",
+        "fin3",
+        "isol",
+        "curs",
+        "aalt",
+        "rand",
+    }
+)
 
 
 def filter_visible_features(feature_tags):
@@ -425,6 +431,50 @@ PROOF_REGISTRY = {
     },
 }
 
+# Display names contain spaces, so the compiler does not intern them the way
+# it does the identifier-like proof keys; intern them for identity fast paths
+for _proof_info in PROOF_REGISTRY.values():
+    _proof_info["display_name"] = sys.intern(_proof_info["display_name"])
+    if "text" in _proof_info:
+        _proof_info["text"] = MappingProxyType(_proof_info["text"])
+del _proof_info
+
+# Freeze the finished registry so entries and text configs can be shared freely
+PROOF_REGISTRY = MappingProxyType(
+    {
+        proof_key: MappingProxyType(proof_info)
+        for proof_key, proof_info in PROOF_REGISTRY.items()
+    }
+)
+
+# Display name -> proof key, built once from the registry (read-only)
+PROOF_NAME_TO_KEY = MappingProxyType(
+    {
+        proof_info["display_name"]: proof_key
+        for proof_key, proof_info in PROOF_REGISTRY.items()
+    }
+)
+
+# Display names longest first, for prefix matching numbered variants in one call
+PROOF_DISPLAY_NAME_PREFIXES = tuple(sorted(PROOF_NAME_TO_KEY, key=len, reverse=True))
+
+# Proof key -> default font size, resolved once from the registry (read-only)
+PROOF_DEFAULT_FONT_SIZES = MappingProxyType(
+    {
+        proof_key: proof_info["default_size"]
+        for proof_key, proof_info in PROOF_REGISTRY.items()
+    }
+)
+
+# Proof key -> nested text config, for proofs that have one (read-only)
+TEXT_PROOF_CONFIGS = MappingProxyType(
+    {
+        proof_key: proof_info["text"]
+        for proof_key, proof_info in PROOF_REGISTRY.items()
+        if "text" in proof_info
+    }
+)
+
 # =============================================================================
 # PROOF REGISTRY HELPER FUNCTIONS
 # =============================================================================
@@ -432,8 +482,7 @@ PROOF_REGISTRY = {
 
 def get_text_proof_config(proof_key):
     """Get nested text config for a proof from the registry, if present."""
-    info = PROOF_REGISTRY.get(proof_key)
-    return info.get("text") if info else None
+    return TEXT_PROOF_CONFIGS.get(proof_key)
 
 
 def resolve_character_set_by_key(cat: dict, key: str) -> str:
@@ -449,36 +498,40 @@ def resolve_character_set_by_key(cat: dict, key: str) -> str:
     return cat.get(key, "") or ""
 
 
-def get_proof_display_names(include_arabic=True):
-    """Get list of proof display names in default order."""
-    proof_order = [
-        "filtered_character_set",
-        "spacing_proof",
-        "basic_paragraph_large",
-        "diacritic_words_large",
-        "basic_paragraph_small",
-        "paired_styles_paragraph_small",
-        "generative_text_small",
-        "diacritic_words_small",
-        "misc_paragraph_small",
-        "ar_character_set",
-        "ar_paragraph_large",
-        "fa_paragraph_large",
-        "ar_paragraph_small",
-        "fa_paragraph_small",
-        "ar_vocalization_paragraph_small",
-        "ar_lat_mixed_paragraph_small",
-        "ar_numbers_small",
-    ]
+# Default proof order, resolved to display names once at import
+_PROOF_ORDER = (
+    "filtered_character_set",
+    "spacing_proof",
+    "basic_paragraph_large",
+    "diacritic_words_large",
+    "basic_paragraph_small",
+    "paired_styles_paragraph_small",
+    "generative_text_small",
+    "diacritic_words_small",
+    "misc_paragraph_small",
+    "ar_character_set",
+    "ar_paragraph_large",
+    "fa_paragraph_large",
+    "ar_paragraph_small",
+    "fa_paragraph_small",
+    "ar_vocalization_paragraph_small",
+    "ar_lat_mixed_paragraph_small",
+    "ar_numbers_small",
+)
+_ORDERED_ALL_NAMES = tuple(
+    PROOF_REGISTRY[key]["display_name"] for key in _PROOF_ORDER if key in PROOF_REGISTRY
+)
+_ORDERED_BASE_NAMES = tuple(
+    PROOF_REGISTRY[key]["display_name"]
+    for key in _PROOF_ORDER
+    if key in PROOF_REGISTRY and not PROOF_REGISTRY[key]["is_arabic"]
+)
 
-    result = []
-    for proof_key in proof_order:
-        if proof_key in PROOF_REGISTRY:
-            proof_info = PROOF_REGISTRY[proof_key]
-            if include_arabic or not proof_info["is_arabic"]:
-                result.append(proof_info["display_name"])
 
-    return result
+def get_proof_display_names(include_arabic=True):
+    """Get list of proof display names in default order."""
+    # Callers may keep and reorder the list, so hand out a copy
+    return list(_ORDERED_ALL_NAMES if include_arabic else _ORDERED_BASE_NAMES)
 
 
 def resolve_base_proof_key(proof_name: str) -> tuple[str | None, str | None]:
@@ -486,110 +539,115 @@ def resolve_base_proof_key(proof_name: str) -> tuple[str | None, str | None]:
 
     Returns (display_name, key) or (None, None) if not found.
     """
-    mapping = get_proof_settings_mapping()
     # Exact match
-    if proof_name in mapping:
-        return proof_name, mapping[proof_name]
-    # Prefix match for numbered variants
-    for display_name in mapping.keys():
-        if proof_name.startswith(display_name):
-            return display_name, mapping[display_name]
+    if proof_name in PROOF_NAME_TO_KEY:
+        return proof_name, PROOF_NAME_TO_KEY[proof_name]
+    # Prefix match for numbered variants; reject non-matches in a single call
+    if proof_name.startswith(PROOF_DISPLAY_NAME_PREFIXES):
+        for display_name in PROOF_DISPLAY_NAME_PREFIXES:
+            if proof_name.startswith(display_name):
+                return display_name, PROOF_NAME_TO_KEY[display_name]
     return None, None
 
 
 def get_proof_settings_mapping():
     """Get mapping from display names to proof keys."""
-    return {
-        proof_info["display_name"]: proof_key
-        for proof_key, proof_info in PROOF_REGISTRY.items()
-    }
+    # Callers only read it, so the shared read-only view is returned as is
+    return PROOF_NAME_TO_KEY
 
 
 # get_proof_popover_mapping removed; use get_proof_settings_mapping() directly
 
 
-def get_proof_default_columns():
-    """Get default column counts for all proofs."""
-    return {
+# Registry-derived defaults, built once and returned as read-only views
+_PROOF_DEFAULT_COLUMNS = MappingProxyType(
+    {
         f"{proof_key}_cols": proof_info["default_cols"]
         for proof_key, proof_info in PROOF_REGISTRY.items()
     }
-
-
-def get_proof_paragraph_settings():
-    """Get proof types that have paragraph settings."""
-    return {
+)
+_PROOF_PARAGRAPH_SETTINGS = MappingProxyType(
+    {
         f"{proof_key}_para": 3  # Default paragraph count
         for proof_key, proof_info in PROOF_REGISTRY.items()
         if proof_info["has_paragraphs"]
     }
+)
+
+
+def get_proof_default_columns():
+    """Get default column counts for all proofs (read-only)."""
+    return _PROOF_DEFAULT_COLUMNS
+
+
+def get_proof_paragraph_settings():
+    """Get proof types that have paragraph settings (read-only)."""
+    return _PROOF_PARAGRAPH_SETTINGS
 
 
 def get_proof_by_display_name(display_name):
     """Get proof info by display name."""
-    for proof_key, proof_info in PROOF_REGISTRY.items():
-        if proof_info["display_name"] == display_name:
-            return proof_info
-    return None
+    proof_key = PROOF_NAME_TO_KEY.get(display_name)
+    return PROOF_REGISTRY[proof_key] if proof_key is not None else None
 
 
-def get_proof_by_settings_key(settings_key):
-    """Get proof info by settings key (now same as proof key)."""
-    return PROOF_REGISTRY.get(settings_key)
+# Settings and storage keys are now the proof key itself, so these lookups
+# (and the backward compatible get_proof_info) are the registry's bound get
+get_proof_by_settings_key = PROOF_REGISTRY.get
+get_proof_by_storage_key = PROOF_REGISTRY.get
+get_proof_info = PROOF_REGISTRY.get
 
 
-def get_proof_by_storage_key(storage_key):
-    """Get proof info by storage key (now same as proof key)."""
-    return PROOF_REGISTRY.get(storage_key)
+_ARABIC_PROOF_DISPLAY_NAMES = tuple(
+    proof_info["display_name"]
+    for proof_info in PROOF_REGISTRY.values()
+    if proof_info["is_arabic"]
+)
+_BASE_PROOF_DISPLAY_NAMES = tuple(
+    proof_info["display_name"]
+    for proof_info in PROOF_REGISTRY.values()
+    if not proof_info["is_arabic"]
+)
 
 
 def get_arabic_proof_display_names():
-    """Get list of Arabic proof display names only."""
-    return [
-        proof_info["display_name"]
-        for proof_info in PROOF_REGISTRY.values()
-        if proof_info["is_arabic"]
-    ]
+    """Get tuple of Arabic proof display names only."""
+    return _ARABIC_PROOF_DISPLAY_NAMES
 
 
 def get_base_proof_display_names():
-    """Get list of non-Arabic proof display names only."""
-    return [
-        proof_info["display_name"]
-        for proof_info in PROOF_REGISTRY.values()
-        if not proof_info["is_arabic"]
-    ]
+    """Get tuple of non-Arabic proof display names only."""
+    return _BASE_PROOF_DISPLAY_NAMES
 
 
 def get_proof_default_font_size(proof_key):
     """Get default font size for a proof type from the registry."""
-    proof_info = PROOF_REGISTRY.get(proof_key)
-    if proof_info:
-        return proof_info["default_size"]
-    return 8  # Fallback to small text size
+    return PROOF_DEFAULT_FONT_SIZES.get(proof_key, 8)  # Fallback to small text size
 
 
-def proof_supports_formatting(proof_key):
-    """Check if a proof type supports text formatting (tracking, alignment)."""
-    # Character Set, Spacing Proof, and Arabic Character Set don't support formatting (they handle it per category)
-    return proof_key not in [
+# Character Set, Spacing Proof, and Arabic Character Set don't support formatting (they handle it per category)
+_UNFORMATTED_PROOFS = frozenset(
+    {
         "filtered_character_set",
         "spacing_proof",
         "ar_character_set",
-    ]
+    }
+)
 
 
-def get_proof_info(proof_key):
-    """Get proof info by proof key (alias for backward compatibility)."""
-    return PROOF_REGISTRY.get(proof_key)
+def proof_supports_formatting(proof_key):
+    """Check if a proof type supports text formatting (tracking, alignment)."""
+    return proof_key not in _UNFORMATTED_PROOFS
 
 
+@cache
 def get_display_name(proof_key):
     """Get display name for a proof key (alias for backward compatibility)."""
     proof_info = PROOF_REGISTRY.get(proof_key)
     return proof_info["display_name"] if proof_info else proof_key
 
 
+@cache
 def get_otf_prefix(proof_key):
     """Get OpenType feature prefix for a proof key."""
     return f"otf_{proof_key}_"
@@ -3,6 +3,7 @@
 
 import os
 import unicodedata
+from functools import lru_cache
 from itertools import product
 from fontTools.ttLib import TTFont
 from fontTools.agl import toUnicode
@@ -44,10 +45,42 @@ def get_ttfont(input_font):
         return None
 
 
+# Callbacks run by clear_font_cache() so other modules can drop per-font caches
+_font_cache_listeners = []
+
+
+def register_font_cache_listener(callback):
+    """Call callback() whenever the font caches are cleared."""
+    _font_cache_listeners.append(callback)
+
+
 def clear_font_cache():
-    """Clear the TTFont cache."""
+    """Clear the TTFont and per-font metadata caches."""
     global _ttfont_cache
     _ttfont_cache.clear()
+    _cached_font_meta.cache_clear()
+    get_font_style.cache_clear()
+    for callback in _font_cache_listeners:
+        callback()
+
+
+@lru_cache(maxsize=64)
+def get_font_style(input_font):
+    """Get (weight class, is italic, best subfamily name) for a font."""
+    f = get_ttfont(input_font)
+    try:
+        weight = f["OS/2"].usWeightClass
+    except Exception:
+        weight = None
+    try:
+        isItalic = bool(f["OS/2"].fsSelection & FsSelection.ITALIC)
+    except Exception:
+        isItalic = False
+    try:
+        subfamilyName = f["name"].getBestSubFamilyName()
+    except Exception:
+        subfamilyName = ""
+    return weight, isItalic, subfamilyName
 
 
 def filteredCharset(input_font):
@@ -204,6 +237,19 @@ def product_dict(**kwargs):
         yield dict(zip(keys, instance))
 
 
+@lru_cache(maxsize=32)
+def _cached_axes_product(axes_items):
+    """LRU-cached axis combinations keyed by (axis, values) pairs in order."""
+    return tuple(product_dict(**dict(axes_items)))
+
+
+def get_axes_product(axes_dict):
+    """Get all axis value combinations for an axes dict as a shared tuple."""
+    return _cached_axes_product(
+        tuple((axis, tuple(values)) for axis, values in axes_dict.items())
+    )
+
+
 def variableFont(input_font):
     """Get variable font axis information and product combinations."""
     variableDict = db.listFontVariations(input_font)
@@ -312,6 +358,20 @@ def find_accented(char):
     return len(decomp) > 1 and unicodedata.category(decomp[1]) == "Mn"
 
 
+@lru_cache(maxsize=None)
+def _classify_char(char):
+    """Return (category, accented, script, Arabic block) for a character."""
+    cat = unicodedata.category(char)
+    accented = cat in ("Ll", "Lu") and find_accented(char)
+    try:
+        char_script = script(char)
+        arabic_block = char_script == "Arab" and block(char) == "Arabic"
+    except (ImportError, AttributeError):
+        # Fallback if fontTools.unicodedata is not available
+        char_script, arabic_block = None, False
+    return cat, accented, char_script, arabic_block
+
+
 def categorize(charset):
     """Categorize characters by Unicode category."""
     cat_map = {
@@ -350,28 +410,25 @@ def categorize(charset):
     )
 
     for char in charset:
-        cat = unicodedata.category(char)
+        # Unicode lookups are memoized per character, so fonts of one family
+        # sharing a charset only pay for them once
+        cat, accented, char_script, arabic_block = _classify_char(char)
         if cat in cat_map:
             result[cat_map[cat]].append(char)
 
         if cat in ("Ll", "Lu"):
             base_key = "uniLlBase" if cat == "Ll" else "uniLuBase"
-            target_key = "accented" if find_accented(char) else base_key
+            target_key = "accented" if accented else base_key
             result[target_key].append(char)
 
         # Script-based categorization
-        try:
-            char_script = script(char)
-            if char_script == "Latn":
-                result["latn"].append(char)
-            elif char_script == "Arab":
-                result["arab"].append(char)
-                # Check if it's specifically Arabic block
-                if block(char) == "Arabic":
-                    result["arabTyped"].append(char)
-        except (ImportError, AttributeError):
-            # Fallback if fontTools.unicodedata is not available
-            pass
+        if char_script == "Latn":
+            result["latn"].append(char)
+        elif char_script == "Arab":
+            result["arab"].append(char)
+            # Check if it's specifically Arabic block
+            if arabic_block:
+                result["arabTyped"].append(char)
 
         # Template-based categorization for Arabic/Farsi
         if char in AR_TEMPLATE:
@@ -466,6 +523,27 @@ def get_character_set(font_path):
     return filteredCharset(font_path)
 
 
+@lru_cache(maxsize=32)
+def _cached_font_meta(font_path, mtime):
+    """LRU-cached per-font proof data keyed by path+mtime."""
+    charset = filteredCharset(font_path)
+    return (
+        charset,
+        categorize(charset),
+        db.listFontVariations(font_path),
+        tuple(db.listOpenTypeFeatures(font_path)),
+    )
+
+
+def get_font_meta(font_path):
+    """Get (charset, categories, variations, feature tags) for a font."""
+    try:
+        mtime = os.path.getmtime(font_path)
+    except Exception:
+        mtime = 0
+    return _cached_font_meta(font_path, mtime)
+
+
 # =============================================================================
 # Font Manager - Core font management functionality
 # =============================================================================
@@ -646,6 +724,8 @@ class FontManager:
         if not valid_paths:
             return False
 
+        # Replaced fonts may reuse paths, so drop anything cached for the old set
+        clear_font_cache()
         self.fonts = tuple(valid_paths)
         self.update_font_info()
 
@@ -2,6 +2,7 @@
 
 import os
 import datetime
+import collections
 import traceback
 import AppKit
 import Quartz.PDFKit as PDFKit
@@ -15,16 +16,49 @@ from settings import (
     get_file_size_formatted,
 )
 from ui import setup_page_format
-from proof import reset_proof_page_counter
+from proof import (
+    invalidate_handler_settings,
+    reset_proof_page_counter,
+)
+
+# ObjC classes resolved once instead of per call
+_PDFDocument = PDFKit.PDFDocument
+_NSWorkspace = AppKit.NSWorkspace
+_fileURLWithPath = AppKit.NSURL.fileURLWithPath_
+
+
+def _stat_or_none(path):
+    """Return os.stat() for a path, or None if it does not exist."""
+    if not path:
+        return None
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
 
 
 class PDFManager:
     """Manages PDF generation, preview, and document operations."""
 
+    MAX_CACHED_DOCUMENTS = 4
+
     def __init__(self, settings):
         self.settings = settings
         self.current_pdf_path = None
-        self.preview_components = self.create_preview_components()
+        # Most recently used PDFDocuments keyed by (path, mtime)
+        self._doc_cache = collections.OrderedDict()
+        # Family name derived from each first-font path
+        self._family_cache = {}
+        self._workspace = _NSWorkspace.sharedWorkspace()
+        # The PDFView is created the first time the preview is needed
+        self._preview_components = None
+
+    @property
+    def preview_components(self):
+        """PDF preview components, created on first access."""
+        if self._preview_components is None:
+            self._preview_components = self.create_preview_components()
+        return self._preview_components
 
     def create_preview_components(self):
         """Create PDF preview components for integration into UI."""
@@ -37,18 +71,45 @@ class PDFManager:
         pdfView.setDisplaysPageBreaks_(True)
         pdfView.setDisplayMode_(1)
         pdfView.setDisplayBox_(0)
+        # Skip per-page work the preview does not need: data detectors scan
+        # page text as it is drawn, and page shadows add compositing cost
+        if hasattr(pdfView, "setEnableDataDetectors_"):
+            pdfView.setEnableDataDetectors_(False)
+        if hasattr(pdfView, "setPageShadowsEnabled_"):
+            pdfView.setPageShadowsEnabled_(False)
 
         components["pdfView"] = pdfView
         return components
 
-    def get_pdf_output_directory(self, font_manager):
+    def _get_pdf_document(self, pdf_path, st=None):
+        """Get a PDFDocument for a path, reusing it while the file is unchanged."""
+        if st is None:
+            st = os.stat(pdf_path)
+        cache_key = (pdf_path, st.st_mtime_ns)
+        pdfDoc = self._doc_cache.get(cache_key)
+        if pdfDoc is not None:
+            self._doc_cache.move_to_end(cache_key)
+            return pdfDoc
+
+        pdfDoc = _PDFDocument.alloc().initWithURL_(_fileURLWithPath(pdf_path))
+        if pdfDoc:
+            self._doc_cache[cache_key] = pdfDoc
+            # Keep only the few most recently used documents in memory
+            while len(self._doc_cache) > self.MAX_CACHED_DOCUMENTS:
+                self._doc_cache.popitem(last=False)
+        return pdfDoc
+
+    def get_pdf_output_directory(self, fonts):
         """Determine the appropriate PDF output directory."""
         try:
-            if font_manager.fonts:
-                first_font_path = normalize_path(font_manager.fonts[0])
-                family_name = os.path.splitext(os.path.basename(first_font_path))[
-                    0
-                ].split("-")[0]
+            if fonts:
+                first_font_path = normalize_path(fonts[0])
+                family_name = self._family_cache.get(first_font_path)
+                if family_name is None:
+                    family_name = os.path.splitext(os.path.basename(first_font_path))[
+                        0
+                    ].split("-")[0]
+                    self._family_cache[first_font_path] = family_name
 
                 # Check if user wants to use custom PDF output location
                 # Ensure pdf_output key exists with defaults
@@ -65,7 +126,7 @@ class PDFManager:
                     "custom_location", ""
                 )
 
-                if use_custom and custom_location and os.path.exists(custom_location):
+                if use_custom and custom_location and os.path.isdir(custom_location):
                     # Use custom location
                     pdf_directory = normalize_path(custom_location)
                 else:
@@ -75,14 +136,14 @@ class PDFManager:
                 return pdf_directory, family_name
             else:
                 # Fallback to script directory if no fonts loaded
-                from core_config import SCRIPT_DIR
+                from config import SCRIPT_DIR
 
                 return normalize_path(SCRIPT_DIR), "proof"
 
         except Exception as e:
             error_msg = f"Error determining PDF output directory: {e}"
             log_error(error_msg)
-            from core_config import SCRIPT_DIR
+            from config import SCRIPT_DIR
 
             return normalize_path(SCRIPT_DIR), "proof"
 
@@ -94,19 +155,27 @@ class PDFManager:
         safe_name = make_safe_filename(f"{timestamp}_{family_name}-proof", ".pdf")
         return safe_name
 
-    def save_pdf_document(self, font_manager, now=None):
+    def save_pdf_document(self, fonts, now=None):
         """Save the current drawBot document as a PDF."""
         try:
-            pdf_directory, family_name = self.get_pdf_output_directory(font_manager)
+            pdf_directory, family_name = self.get_pdf_output_directory(fonts)
             pdf_filename = self.generate_pdf_filename(family_name, now)
             pdf_path = os.path.join(pdf_directory, pdf_filename)
 
             # Ensure output directory exists
             ensure_directory_exists(pdf_directory)
 
-            # Save the PDF using drawBot
-            db.saveImage(pdf_path)
-            self.current_pdf_path = pdf_path
+            # Serialize the drawing in memory and write it here; generation
+            # already runs off the main thread, so the write never blocks the UI
+            pdfDoc = db.pdfImage()
+            if pdfDoc is None:
+                log_error(f"Error saving PDF: nothing was drawn for {pdf_path}")
+                return None
+            if not pdfDoc.dataRepresentation().writeToFile_atomically_(pdf_path, True):
+                log_error(f"Error saving PDF: could not write {pdf_path}")
+                return None
+            # Publish the path only once the file is on disk
+            self.set_current_pdf_path(pdf_path)
 
             # Log with file size
             file_size = get_file_size_formatted(pdf_path)
@@ -123,11 +192,10 @@ class PDFManager:
         if pdf_path is None:
             pdf_path = self.current_pdf_path
 
-        if pdf_path and os.path.exists(pdf_path):
+        st = _stat_or_none(pdf_path)
+        if st:
             try:
-                pdfDoc = PDFKit.PDFDocument.alloc().initWithURL_(
-                    AppKit.NSURL.fileURLWithPath_(pdf_path)
-                )
+                pdfDoc = self._get_pdf_document(pdf_path, st)
                 self.preview_components["pdfView"].setDocument_(pdfDoc)
                 return True
             except Exception as e:
@@ -151,11 +219,10 @@ class PDFManager:
         if pdf_path is None:
             pdf_path = self.current_pdf_path
 
-        if pdf_path and os.path.exists(pdf_path):
+        if _stat_or_none(pdf_path):
             try:
                 # Use NSWorkspace to open the PDF
-                workspace = AppKit.NSWorkspace.sharedWorkspace()
-                workspace.openFile_(pdf_path)
+                self._workspace.openURL_(_fileURLWithPath(pdf_path))
                 return True
             except Exception as e:
                 print(f"Error opening PDF externally: {e}")
@@ -167,14 +234,13 @@ class PDFManager:
         if pdf_path is None:
             pdf_path = self.current_pdf_path
 
-        if pdf_path and os.path.exists(pdf_path):
+        st = _stat_or_none(pdf_path)
+        if st:
             try:
-                pdfDoc = PDFKit.PDFDocument.alloc().initWithURL_(
-                    AppKit.NSURL.fileURLWithPath_(pdf_path)
-                )
+                pdfDoc = self._get_pdf_document(pdf_path, st)
                 if pdfDoc:
                     page_count = pdfDoc.pageCount()
-                    file_size = os.path.getsize(pdf_path)
+                    file_size = st.st_size
                     return {
                         "path": pdf_path,
                         "page_count": page_count,
@@ -190,13 +256,13 @@ class PDFManager:
         if pdf_path is None:
             pdf_path = self.current_pdf_path
 
-        if not pdf_path or not os.path.exists(pdf_path):
+        if not _stat_or_none(pdf_path):
             return False
 
         try:
-            pdfDoc = PDFKit.PDFDocument.alloc().initWithURL_(
-                AppKit.NSURL.fileURLWithPath_(pdf_path)
-            )
+            # Export from a document of its own, never the cached one the
+            # preview is drawing from
+            pdfDoc = _PDFDocument.alloc().initWithURL_(_fileURLWithPath(pdf_path))
             if not pdfDoc:
                 return False
 
@@ -206,23 +272,31 @@ class PDFManager:
 
             base_name = os.path.splitext(os.path.basename(pdf_path))[0]
             exported_files = []
+            failed_count = 0
+            # One scratch document holds each exported page in turn
+            scratch = _PDFDocument.alloc().init()
 
             for page_index in page_range:
                 if 0 <= page_index < total_pages:
                     page = pdfDoc.pageAtIndex_(page_index)
                     if page:
-                        # Create a new document with just this page
-                        new_doc = PDFKit.PDFDocument.alloc().init()
-                        new_doc.insertPage_atIndex_(page, 0)
+                        # Swap this page in as the scratch document's only page
+                        if scratch.pageCount():
+                            scratch.removePageAtIndex_(0)
+                        scratch.insertPage_atIndex_(page.copy(), 0)
 
                         # Save the single page
                         output_filename = make_safe_filename(
                             f"{base_name}_page_{page_index + 1}", ".pdf"
                         )
                         output_path = os.path.join(output_directory, output_filename)
-                        new_doc.writeToFile_(output_path)
-                        exported_files.append(output_path)
+                        if scratch.writeToFile_(output_path):
+                            exported_files.append(output_path)
+                        else:
+                            failed_count += 1
 
+            if failed_count:
+                log_error(f"Could not write {failed_count} exported pages")
             print(f"Exported {len(exported_files)} pages to {output_directory}")
             return exported_files
 
@@ -245,17 +319,18 @@ class PDFManager:
         try:
             self.setup_page_format()
             reset_proof_page_counter()  # Reset page counter for new proof
+            invalidate_handler_settings()  # Settings may have changed since
             db.newDrawing()
             return True
         except Exception as e:
             log_error(f"Error beginning PDF generation: {e}")
             return False
 
-    def end_pdf_generation(self, font_manager, now=None):
+    def end_pdf_generation(self, fonts, now=None):
         """Finalize PDF generation and save the document."""
         try:
             db.endDrawing()
-            return self.save_pdf_document(font_manager, now)
+            return self.save_pdf_document(fonts, now)
         except Exception as e:
             log_error(f"Error ending PDF generation: {e}")
             return None
@@ -267,3 +342,4 @@ class PDFManager:
     def set_current_pdf_path(self, path):
         """Set the path of the current PDF."""
         self.current_pdf_path = path
+        self._doc_cache.clear()
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import collections
 import datetime
 import os
 import random
 import traceback
 import unicodedata
-from typing import Optional, Iterator, Any
+from typing import Optional, Iterator, Any, NamedTuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property, lru_cache
 
 import drawBot as db
 from wordsiv import Vocab, WordSiv
@@ -22,26 +25,33 @@ from config import (
     useFontContainsCharacters,
     wordsivSeed,
     dualStyleSeed,
-    FsSelection,
     posForms,
     DEFAULT_ON_FEATURES,
     DEFAULT_CHARSET_TRACKING,
     FOOTER_FONT_NAME,
     FOOTER_FONT_SIZE,
     FOOTER_FEATURES_FONT_SIZE,
+    PROOF_NAME_TO_KEY,
     get_proof_default_font_size,
     get_text_proof_config,
     resolve_character_set_by_key,
 )
 from fonts import (
-    get_ttfont,
+    get_charset_proof_categories,
+    get_font_meta,
+    get_font_style,
+    register_font_cache_listener,
     UPPER_TEMPLATE as upperTemplate,
     LOWER_TEMPLATE as lowerTemplate,
 )
-from settings import make_settings_key, create_unique_proof_key
+from settings import make_settings_key, create_unique_proof_key, log_error
 
 # product_dict not used in this module
 
+# Letters a font needs before the pre-made sample texts can be used
+_UPPER_TEMPLATE_SET = frozenset(upperTemplate)
+_LOWER_TEMPLATE_SET = frozenset(lowerTemplate)
+
 try:
     from drawBotGrid import BaselineGrid, columnBaselineGridTextBox
 except ImportError:
@@ -98,10 +108,24 @@ except ImportError:
     bigRandomNumbers = ""
     additionalSmallText = ""
 
+# Full tracebacks for re-raised drawing errors are printed only when debugging
+_DEBUG = os.environ.get("PROOF_DEBUG") == "1"
+
 # Module-level page counter to control displayed page numbers independent of DrawBot internals
 _PROOF_PAGE_INDEX = 0
 
 
+# Bumped whenever proof settings may have changed; cached handlers compare
+# against it before reusing their cached setting values
+_settings_generation = 0
+
+
+def invalidate_handler_settings() -> None:
+    """Mark cached handler settings stale; call when starting a new PDF."""
+    global _settings_generation
+    _settings_generation += 1
+
+
 def reset_proof_page_counter() -> None:
     """Reset the proof page counter. Call this when starting a new PDF generation."""
     global _PROOF_PAGE_INDEX
@@ -168,8 +192,11 @@ def _render_proof_content(
         direction: Text direction ("ltr" or "rtl")
         skip_none_result: If True, skip rendering when stringMaker returns None
     """
-    for suffix, axisDict in _normalize_axes(axesProduct, indFont):
-        formatted_string = stringMaker(
+    # Footer values are shared by every axes variation of this section
+    footer_ctx = make_footer_context(indFont, otFeatures, trackingInput)
+
+    def build(axisDict):
+        return stringMaker(
             textInput,
             fontSize,
             indFont,
@@ -182,6 +209,11 @@ def _render_proof_content(
             mixedStyles=mixedStyles,
         )
 
+    # FormattedStrings resolve fonts through DrawBot and CoreText, so they are
+    # built here on the drawing thread; only their pure-Python inputs (words,
+    # pairing, style runs) are prepared once and shared across variations
+    for suffix, axisDict in _normalize_axes(axesProduct, indFont):
+        formatted_string = build(axisDict)
         # Skip if no valid result (e.g., mixed styles with no valid pairing)
         if skip_none_result and formatted_string is None:
             continue
@@ -194,9 +226,13 @@ def _render_proof_content(
             direction,
             otFeatures,
             trackingInput,
+            footer_ctx=footer_ctx,
         )
+        # Release the drawn string as soon as its pages are done
+        del formatted_string
 
 
+@lru_cache(maxsize=64)
 def get_font_display_name(indFont: str) -> str:
     """Get the display name for a font, extracting the style from the font name."""
     try:
@@ -208,114 +244,154 @@ def get_font_display_name(indFont: str) -> str:
         return "Unknown"
 
 
+# Forget display names when fonts are reloaded
+register_font_cache_listener(get_font_display_name.cache_clear)
+
+
 # =============================================================================
 # Core Drawing Functions
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class FooterContext:
+    """Footer values that stay the same for every page of a proof section."""
+
+    date_str: str
+    time_str: str
+    familyName: str
+    features_text: str
+
+
+def _features_footer_text(
+    otFeatures: Optional[dict], tracking: Optional[int | float]
+) -> str:
+    """Describe non-default OpenType features and tracking for the footer."""
+    ot_items = tuple(sorted(otFeatures.items())) if otFeatures else ()
+    return _cached_features_footer_text(ot_items, tracking)
+
+
+@lru_cache(maxsize=128)
+def _cached_features_footer_text(
+    ot_items: tuple, tracking: Optional[int | float]
+) -> str:
+    """LRU-cached footer features text keyed by sorted (feature, enabled) pairs."""
+    # Calculate feature info text if OpenType features are provided
+    features_text = ""
+    if ot_items:
+        enabled = frozenset(feature for feature, value in ot_items if value)
+        disabled = frozenset(feature for feature, value in ot_items if not value)
+        # Features that are ON but usually OFF by default, and vice versa
+        features_enabled = sorted(enabled - DEFAULT_ON_FEATURES)
+        features_disabled = sorted(disabled & DEFAULT_ON_FEATURES)
+
+        # Build features text
+        features_parts = []
+        if features_enabled:
+            features_parts.append(f"ON: {', '.join(features_enabled)}")
+        if features_disabled:
+            features_parts.append(f"OFF: {', '.join(features_disabled)}")
+
+        if features_parts:
+            features_text = " - ".join(features_parts)
+
+    # Add tracking information if it's not 0
+    if tracking is not None and tracking != 0:
+        tracking_text = f"Tracking: {tracking}"
+        if features_text:
+            features_text += f" | {tracking_text}"
+        else:
+            features_text = tracking_text
+
+    return features_text
+
+
+def make_footer_context(
+    indFont: str,
+    otFeatures: Optional[dict] = None,
+    tracking: Optional[int | float] = None,
+) -> FooterContext:
+    """Compute the per-section footer values once for all of its pages."""
+    # get date/time and font name
+    now = datetime.datetime.now()
+    fontFileName = os.path.basename(indFont)
+    return FooterContext(
+        date_str=str(now.date()),
+        time_str=now.strftime("%H:%M"),
+        familyName=os.path.splitext(fontFileName)[0].split("-")[0],
+        features_text=_features_footer_text(otFeatures, tracking),
+    )
+
+
+def _new_footer_string(
+    text: str, fontSize: int | float, align: Optional[str] = None
+) -> db.FormattedString:
+    """Footer FormattedString in the footer font."""
+    return db.FormattedString(
+        text,
+        font=FOOTER_FONT_NAME,
+        fontSize=fontSize,
+        lineHeight=fontSize,
+        align=align,
+    )
+
+
+# Only page-invariant footer lines go through the cache; per-page text such as
+# the folio would make every key unique and just pin dead strings
+@lru_cache(maxsize=256)
+def _footer_string(text: str, fontSize: int | float) -> db.FormattedString:
+    """Shared footer FormattedString; textBox only reads it, so reuse is safe."""
+    return _new_footer_string(text, fontSize)
+
+
 def drawFooter(
     title: str,
     indFont: str,
     otFeatures: Optional[dict] = None,
     tracking: Optional[int | float] = None,
     pageNumber: Optional[int] = None,
+    ctx: Optional[FooterContext] = None,
 ) -> None:
     """Draw a simple footer with some minimal but useful info."""
+    if ctx is None:
+        ctx = make_footer_context(indFont, otFeatures, tracking)
+
     with db.savedState():
-        # get date/time and font name
-        now = datetime.datetime.now()
-        date_str = now.date()
-        time_str = now.strftime("%H:%M")
-        fontFileName = os.path.basename(indFont)
-        familyName = os.path.splitext(fontFileName)[0].split("-")[0]
         # assemble footer text
-        footerText = f"{date_str} {time_str} | {familyName} | {title}"
-
-        # and display formatted string
-        footer = db.FormattedString(
-            footerText,
-            font=FOOTER_FONT_NAME,
-            fontSize=FOOTER_FONT_SIZE,
-            lineHeight=FOOTER_FONT_SIZE,
-        )
+        footerText = f"{ctx.date_str} {ctx.time_str} | {ctx.familyName} | {title}"
+
         # Use provided pageNumber when available; fallback to DrawBot's pageCount
         current_page_str = (
             str(pageNumber) if pageNumber is not None else str(db.pageCount())
         )
-        folio = db.FormattedString(
-            current_page_str,
-            font=FOOTER_FONT_NAME,
-            fontSize=FOOTER_FONT_SIZE,
-            lineHeight=FOOTER_FONT_SIZE,
-            align="right",
-        )
-
-        # Calculate feature info text if OpenType features are provided
-        features_text = ""
-        if otFeatures:
-            features_enabled = []
-            features_disabled = []
-
-            for feature, enabled in otFeatures.items():
-                if enabled and feature not in DEFAULT_ON_FEATURES:
-                    # Feature is ON but usually OFF by default
-                    features_enabled.append(feature)
-                elif not enabled and feature in DEFAULT_ON_FEATURES:
-                    # Feature is OFF but usually ON by default
-                    features_disabled.append(feature)
-
-            # Build features text
-            features_parts = []
-            if features_enabled:
-                features_parts.append(f"ON: {', '.join(sorted(features_enabled))}")
-            if features_disabled:
-                features_parts.append(f"OFF: {', '.join(sorted(features_disabled))}")
-
-            if features_parts:
-                features_text = " - ".join(features_parts)
-
-        # Add tracking information if it's not 0
-        if tracking is not None and tracking != 0:
-            tracking_text = f"Tracking: {tracking}"
-            if features_text:
-                features_text += f" | {tracking_text}"
-            else:
-                features_text = tracking_text
-
-        # Main footer line
-        db.textBox(
-            footer,
-            (
-                marginHorizontal,
-                marginVertical - 18,
-                db.width() - marginHorizontal * 2,
-                FOOTER_FONT_SIZE,
-            ),
-        )
-        db.textBox(
-            folio,
-            (
-                marginHorizontal,
-                marginVertical - 18,
-                db.width() - marginHorizontal * 2,
-                FOOTER_FONT_SIZE,
-            ),
+        features_text = ctx.features_text
+        footerWidth = db.width() - marginHorizontal * 2
+
+        # Main footer line is the same on every page of a section; the folio
+        # changes per page and gets its own right-aligned box so a long title
+        # can never push it onto a clipped second line
+        footer = _footer_string(footerText, FOOTER_FONT_SIZE)
+        folio = _new_footer_string(current_page_str, FOOTER_FONT_SIZE, "right")
+        footerBox = (
+            marginHorizontal,
+            marginVertical - 18,
+            footerWidth,
+            FOOTER_FONT_SIZE,
         )
+        db.textBox(footer, footerBox)
+        db.textBox(folio, footerBox)
 
         # Features line (if any features to display)
         if features_text:
-            features_footer = db.FormattedString(
-                f"OT Fea: {features_text}",
-                font=FOOTER_FONT_NAME,
-                fontSize=FOOTER_FEATURES_FONT_SIZE,
-                lineHeight=FOOTER_FEATURES_FONT_SIZE,
+            features_footer = _footer_string(
+                f"OT Fea: {features_text}", FOOTER_FEATURES_FONT_SIZE
             )
             db.textBox(
                 features_footer,
                 (
                     marginHorizontal,
                     marginVertical - 28,  # 10 points below main footer
-                    db.width() - marginHorizontal * 2,
+                    footerWidth,
                     FOOTER_FEATURES_FONT_SIZE,
                 ),
             )
@@ -362,8 +438,9 @@ def stringMaker(
             return textString
 
     except Exception as e:
-        print(f"Error in stringMaker: {e}")
-        traceback.print_exc()
+        log_error(f"Error in stringMaker: {e}")
+        if _DEBUG:
+            traceback.print_exc()
         raise
 
 
@@ -381,55 +458,15 @@ def _handle_mixed_styles(
         textString.append(txt=textInput)
         return textString
 
-    random.seed(a=dualStyleSeed)
-    f = get_ttfont(indFont)
-    # Basic font properties used for pairing decisions
-    try:
-        weight = f["OS/2"].usWeightClass
-    except Exception:
-        weight = None
-    try:
-        isItalic = bool(f["OS/2"].fsSelection & FsSelection.ITALIC)
-    except Exception:
-        isItalic = False
-    try:
-        subfamilyName = f["name"].getBestSubFamilyName()
-    except Exception:
-        subfamilyName = ""
-
-    # 1) Static Regular/Bold pairing: generate once using Regular as the base
-    if (
-        pairedStaticStyles[1]
-        and subfamilyName == "Regular"
-        and subfamilyName in pairedStaticStyles[1]
-    ):
-        try:
-            rgFont, bdFont = pairedStaticStyles[1][subfamilyName]
-            _apply_alternating_fonts(textString, textInput, [rgFont, bdFont])
-            return textString
-        except Exception:
-            # If RB mapping not available, fall through
-            pass
+    # Tokenize and split into style runs once; every axes variation of a
+    # section reuses the same runs
+    runs = _alternating_runs_for(_split_words(textInput))
 
-    # 2) Static upright/italic pairing.
-    # Non-Regular weights: generate on the upright only to avoid duplicates.
-    # Regular weight (OS/2 usWeightClass == 400): generate UI on the Italic run so Regular can produce RB above.
-    if pairedStaticStyles[0] and weight is not None and weight in pairedStaticStyles[0]:
-        try:
-            upFont, itFont = pairedStaticStyles[0][weight]
-            if weight == 400:
-                # For Regular weight, only generate UI when current font is the Italic instance
-                if isItalic:
-                    _apply_alternating_fonts(textString, textInput, [upFont, itFont])
-                    return textString
-            else:
-                # For non-Regular weights, generate UI once from the upright
-                if not isItalic:
-                    _apply_alternating_fonts(textString, textInput, [upFont, itFont])
-                    return textString
-        except Exception:
-            # Fall through to other strategies if mapping not available
-            pass
+    # Static Regular/Bold or upright/italic pairing, looked up by font style
+    fonts = _static_pair_for_font(pairedStaticStyles, indFont)
+    if fonts:
+        _apply_alternating_fonts(textString, runs, list(fonts))
+        return textString
 
     # Variable font italic axis mixing
     if (
@@ -438,9 +475,7 @@ def _handle_mixed_styles(
         and "ital" in VFAxisInput
         and VFAxisInput["ital"] != 0
     ):
-        _apply_alternating_variations(
-            textString, textInput, VFAxisInput, "ital", [0.0, 1.0]
-        )
+        _apply_alternating_variations(textString, runs, VFAxisInput, "ital", [0.0, 1.0])
         return textString
 
     # Static font regular/bold mixing
@@ -454,7 +489,7 @@ def _handle_mixed_styles(
         and VFAxisInput["wght"] == 700
     ):
         _apply_alternating_variations(
-            textString, textInput, VFAxisInput, "wght", [400.0, 700.0]
+            textString, runs, VFAxisInput, "wght", [400.0, 700.0]
         )
         return textString
 
@@ -462,21 +497,109 @@ def _handle_mixed_styles(
     return None
 
 
-def _apply_alternating_fonts(textString, textInput, fonts):
-    """Apply alternating fonts to words."""
-    for i, word in enumerate(textInput.split()):
-        if i % random.randrange(1, 5) == 0:
-            textString.append(txt="", font=fonts[i % 2])
-        textString.append(txt=word + " ")
+def _resolve_static_pair(upItPairs, rgBdPairs, weight, isItalic, subfamilyName):
+    """Pick the static font pair a font with this style alternates with."""
+    # Regular/Bold is generated once, using Regular as the base
+    if subfamilyName == "Regular" and subfamilyName in rgBdPairs:
+        return rgBdPairs[subfamilyName]
+    # Upright/italic: Regular weight (OS/2 usWeightClass == 400) generates on the
+    # Italic so Regular can produce RB above; other weights generate on the upright
+    if weight is not None and weight in upItPairs and isItalic == (weight == 400):
+        return upItPairs[weight]
+    return None
+
+
+def build_pairing_table(pairedStaticStyles) -> dict:
+    """Map (weight, isItalic, subfamilyName) of each paired font to its pair."""
+    upItPairs, rgBdPairs = pairedStaticStyles
+    table = {}
+    for pair in (*upItPairs.values(), *rgBdPairs.values()):
+        for font in pair:
+            style = get_font_style(font)
+            table[style] = _resolve_static_pair(upItPairs, rgBdPairs, *style)
+    return table
+
+
+# Pairing table for the most recent pairedStaticStyles, which stays the same
+# object for a whole proof run
+_pairing_table_memo = (None, None)
+
 
+def _static_pair_for_font(pairedStaticStyles, indFont):
+    """Return the static font pair to alternate for indFont, or None."""
+    global _pairing_table_memo
+    memo_styles, table = _pairing_table_memo
+    if memo_styles is not pairedStaticStyles:
+        table = build_pairing_table(pairedStaticStyles)
+        _pairing_table_memo = (pairedStaticStyles, table)
 
-def _apply_alternating_variations(textString, textInput, VFAxisInput, axis, values):
-    """Apply alternating font variations to words."""
-    for i, word in enumerate(textInput.split()):
-        if i % random.randrange(1, 5) == 0:
-            VFAxisInput[axis] = values[i % 2]
-            textString.append(txt="", fontVariations=VFAxisInput)
-        textString.append(txt=word + " ")
+    style = get_font_style(indFont)
+    if style not in table:
+        # Fonts outside every pair can still match by style
+        table[style] = _resolve_static_pair(*pairedStaticStyles, *style)
+    return table[style]
+
+
+def _alternating_runs(words, rng):
+    """Split words into runs, yielding (switch index, run text) per run.
+
+    A new run starts wherever the alternation switches styles; the random
+    sequence is drawn from rng exactly as the per-word loop did, one draw per
+    word.
+    """
+    start = 0
+    switch_index = None
+    for i in range(len(words)):
+        if i % rng.randrange(1, 5) == 0:
+            if switch_index is not None or i > start:
+                yield switch_index, " ".join(words[start:i]) + " "
+            start = i
+            switch_index = i
+    if start < len(words):
+        yield switch_index, " ".join(words[start:]) + " "
+
+
+@lru_cache(maxsize=8)
+def _split_words(textInput):
+    """Split text into a shared tuple of words."""
+    return tuple(textInput.split())
+
+
+@lru_cache(maxsize=8)
+def _alternating_runs_for(words):
+    """Seeded style runs for words, shared by every variation of a section."""
+    # Private generator so the seeded alternation neither depends on nor
+    # disturbs the process-wide random state
+    return tuple(_alternating_runs(words, random.Random(dualStyleSeed)))
+
+
+def _apply_alternating_fonts(textString, runs, fonts):
+    """Apply alternating fonts to words, one append per same-font run."""
+    for switch_index, run_text in runs:
+        if switch_index is None:
+            textString.append(txt=run_text)
+        else:
+            textString.append(txt=run_text, font=fonts[switch_index % 2])
+
+
+def _apply_alternating_variations(textString, runs, VFAxisInput, axis, values):
+    """Apply alternating font variations to words, one append per run."""
+    for switch_index, run_text in runs:
+        if switch_index is None:
+            textString.append(txt=run_text)
+        else:
+            VFAxisInput[axis] = values[switch_index % 2]
+            textString.append(txt=run_text, fontVariations=VFAxisInput)
+
+
+@lru_cache(maxsize=8)
+def _baseline_grid(line_height: float, page_width: float, page_height: float):
+    """Baseline grid for the current page size, reused while it is unchanged."""
+    # from_margins measures the current page, so its size is part of the key
+    return BaselineGrid.from_margins(
+        (0, -marginVertical, 0, -marginVertical),
+        line_height,
+    )
 
 
 def drawContent(
@@ -487,15 +610,21 @@ def drawContent(
     direction: str = "ltr",
     otFeatures: Optional[dict] = None,
     tracking: Optional[int | float] = None,
+    footer_ctx: Optional[FooterContext] = None,
 ) -> None:
     """Function to draw content with proper layout."""
     try:
-        showBaselines = (
-            getattr(db, "showBaselines", True) if hasattr(db, "showBaselines") else True
-        )
+        showBaselines = getattr(db, "showBaselines", True)
+        use_grid = BaselineGrid and columnBaselineGridTextBox
+        # Every page uses pageDimensions, so the text frame is measured once
+        page_size = textFrame = None
 
         global _PROOF_PAGE_INDEX
 
+        # Footer values are the same on every page of this content
+        if footer_ctx is None:
+            footer_ctx = make_footer_context(currentFont, otFeatures, tracking)
+
         while textToDraw:
             db.newPage(pageDimensions)
             _PROOF_PAGE_INDEX += 1
@@ -505,47 +634,42 @@ def drawContent(
                 otFeatures,
                 tracking,
                 pageNumber=_PROOF_PAGE_INDEX,
+                ctx=footer_ctx,
             )
             db.hyphenation(False)
 
-            if BaselineGrid and columnBaselineGridTextBox:
-                baselines = BaselineGrid.from_margins(
-                    (0, -marginVertical, 0, -marginVertical),
-                    textToDraw.fontLineHeight() / 2,
+            if page_size is None:
+                page_size = (db.width(), db.height())
+                textFrame = (
+                    marginHorizontal,
+                    marginVertical,
+                    page_size[0] - marginHorizontal * 2,
+                    page_size[1] - marginVertical * 2,
                 )
 
-                if getattr(db, "showBaselines", True):
+            if use_grid:
+                baselines = _baseline_grid(textToDraw.fontLineHeight() / 2, *page_size)
+
+                if showBaselines:
                     baselines.draw(show_index=True)
 
                 textToDraw = columnBaselineGridTextBox(
                     textToDraw,
-                    (
-                        marginHorizontal,
-                        marginVertical,
-                        db.width() - marginHorizontal * 2,
-                        db.height() - marginVertical * 2,
-                    ),
+                    textFrame,
                     baselines,
                     subdivisions=columnNumber,
                     gutter=20,
-                    draw_grid=getattr(db, "showBaselines", True),
+                    draw_grid=showBaselines,
                     direction=direction,
                 )
             else:
                 # Fallback to simple text box without grid
-                textToDraw = db.textBox(
-                    textToDraw,
-                    (
-                        marginHorizontal,
-                        marginVertical,
-                        db.width() - marginHorizontal * 2,
-                        db.height() - marginVertical * 2,
-                    ),
-                )
+                textToDraw = db.textBox(textToDraw, textFrame)
 
     except Exception as e:
-        print(f"Error in drawContent: {e}")
-        traceback.print_exc()
+        log_error(f"Error in drawContent: {e}")
+        if _DEBUG:
+            traceback.print_exc()
         raise
 
 
@@ -554,11 +678,28 @@ def drawContent(
 # =============================================================================
 
 
+class ProofKind(IntEnum):
+    """Text proof size class, derived from the proof's font size."""
+
+    SMALL = 0
+    NORMAL = 1
+    LARGE = 2
+
+    @classmethod
+    def for_size(cls, textSize):
+        """Classify a text size against the small and large proof defaults."""
+        if textSize == get_proof_default_font_size("large_text_proof"):
+            return cls.LARGE
+        if textSize == get_proof_default_font_size("small_text_proof"):
+            return cls.SMALL
+        return cls.NORMAL
+
+
 def generateTextProofString(
     characterSet,
     para=2,
     casing=False,
-    bigProof=True,
+    kind=ProofKind.LARGE,
     forceWordsiv=False,
     cat=None,
     fullCharacterSet=None,
@@ -572,34 +713,22 @@ def generateTextProofString(
     # Handle Arabic/Farsi languages with specific logic
     if lang in ["ar", "fa"]:
         return _generate_arabic_farsi_text(
-            characterSet, para, bigProof, lang, cat, fullCharacterSet
+            characterSet, para, kind, lang, cat, fullCharacterSet
         )
 
     textProofString = ""
-    upper_set = set(cat["uniLu"])
-    lower_set = set(cat["uniLl"])
+    # Pre-made texts need every template letter; only check when they are usable
+    has_upper = has_lower = False
+    if pte and forceWordsiv is False:
+        has_upper = _UPPER_TEMPLATE_SET.issubset(cat["uniLu"])
+        has_lower = _LOWER_TEMPLATE_SET.issubset(cat["uniLl"])
 
     # Use pre-made texts if available and conditions are met
-    if (
-        pte
-        and cat["uppercaseOnly"]
-        and all(x in upper_set for x in upperTemplate)
-        and forceWordsiv is False
-    ):
+    if cat["uppercaseOnly"] and has_upper:
         textProofString = pte.smallUpperText
-    elif (
-        pte
-        and cat["lowercaseOnly"]
-        and all(x in lower_set for x in lowerTemplate)
-        and forceWordsiv is False
-    ):
+    elif cat["lowercaseOnly"] and has_lower:
         textProofString = pte.smallLowerText
-    elif (
-        pte
-        and all(x in upper_set for x in upperTemplate)
-        and all(x in lower_set for x in lowerTemplate)
-        and forceWordsiv is False
-    ):
+    elif has_upper and has_lower:
         textProofString = pte.smallMixedText + " " + pte.smallUpperText
     elif (
         cat["uppercaseOnly"] is False
@@ -627,12 +756,39 @@ def generateTextProofString(
     return textProofString
 
 
+@lru_cache(maxsize=256)
+def _get_wsv(glyphs=None, vocab=None):
+    """Shared WordSiv instance, so each vocab model is loaded once.
+
+    Callers reseed with wsv.seed(wordsivSeed) wherever the old code built a
+    fresh seeded instance, which keeps the generated text unchanged.
+    """
+    return WordSiv(vocab=vocab, glyphs=glyphs)
+
+
+# Character categories whose glyphs WordSiv may use for running text
+_WORDSIV_TEXT_GLYPH_KEYS = (
+    "uniLu",
+    "uniLl",
+    "uniNd",
+    "uniPo",
+    "uniPc",
+    "uniPd",
+    "uniPi",
+    "uniPf",
+)
+
+
 def _generate_wordsiv_text(cat, para, fullCharacterSet, characterSet):
     """Generate text using WordSiv for mixed case scenarios."""
     caplc = []
+    wsv = _get_wsv(None, "en")
+    # Seed here too so wsv.text() below is seeded even with no base capitals
+    wsv.seed(wordsivSeed)
+    ll_base = cat["uniLlBase"]
     for u in cat["uniLuBase"]:
-        capAndLower = u + cat["uniLlBase"]
-        wsv = WordSiv(vocab="en", seed=wordsivSeed)
+        capAndLower = u + ll_base
+        wsv.seed(wordsivSeed)
         capitalisedList = wsv.words(
             glyphs=capAndLower,
             case="cap",
@@ -641,7 +797,7 @@ def _generate_wordsiv_text(cat, para, fullCharacterSet, characterSet):
             max_wl=14,
         )
         if capitalisedList:
-            capitalisedString = " ".join(str(elem) for elem in capitalisedList)
+            capitalisedString = " ".join(map(str, capitalisedList))
             caplc.append(capitalisedString + " ")
         lcList = wsv.words(
             glyphs=capAndLower,
@@ -652,20 +808,12 @@ def _generate_wordsiv_text(cat, para, fullCharacterSet, characterSet):
             max_wl=14,
         )
         if lcList:
-            lcString = " ".join(str(elem) for elem in lcList)
+            lcString = " ".join(map(str, lcList))
             caplc.append(lcString + " ")
 
     caplc_str = "".join(caplc)
     wsvtext = wsv.text(
-        glyphs=cat["uniLu"]
-        + cat["uniLl"]
-        + cat["uniNd"]
-        + cat["uniPo"]
-        + cat["uniPc"]
-        + cat["uniPd"]
-        + cat["uniPi"]
-        + cat["uniPf"]
-        + "()",
+        glyphs="".join(cat[key] for key in _WORDSIV_TEXT_GLYPH_KEYS) + "()",
         numbers=0.1,
         rnd_punc=0.1,
         n_paras=para,
@@ -830,19 +978,30 @@ def _generate_hoefler_style_text(cat, para, fullCharacterSet, characterSet):
     return lc_proof + "\n\n" + uc_proof
 
 
+@lru_cache(maxsize=32)
+def _initial_glyph_sets(initials, helper):
+    """WordSiv glyph sets pairing each initial with the shared helper glyphs."""
+    return tuple(f"{initial}{helper}" for initial in initials)
+
+
 def _generate_uppercase_text(cat, para, fullCharacterSet, characterSet):
     """Generate text for uppercase-only fonts."""
     upperInitials = []
     upperInitialsHelper = (fullCharacterSet or characterSet or "").lower()
 
-    for u in cat["uniLu"]:
-        individualUpper = u + upperInitialsHelper
-        upperwsv = WordSiv(glyphs=individualUpper, seed=wordsivSeed)
+    upperwsv = _get_wsv()
+    for individualUpper in _initial_glyph_sets(cat["uniLu"], upperInitialsHelper):
+        upperwsv.seed(wordsivSeed)
         upperList = upperwsv.words(
-            vocab="en", case="cap", n_words=4, min_wl=5, max_wl=14
+            glyphs=individualUpper,
+            vocab="en",
+            case="cap",
+            n_words=4,
+            min_wl=5,
+            max_wl=14,
         )
         if upperList:
-            upperInitialsString = " ".join(str(elem) for elem in upperList)
+            upperInitialsString = " ".join(map(str, upperList))
             upperInitials.append(upperInitialsString.upper() + " ")
 
     upperInitials_str = "".join(upperInitials)
@@ -854,7 +1013,7 @@ def _generate_uppercase_text(cat, para, fullCharacterSet, characterSet):
         max_wl=14,
         case="uc",
     )
-    return upperInitials_str + "- " + " ".join(str(elem) for elem in wsvtext)
+    return upperInitials_str + "- " + " ".join(map(str, wsvtext))
 
 
 def _generate_lowercase_text(cat, para, fullCharacterSet, characterSet):
@@ -862,13 +1021,19 @@ def _generate_lowercase_text(cat, para, fullCharacterSet, characterSet):
     lowerInitials = []
     lowerHelper = fullCharacterSet or characterSet or ""
 
-    for lower in cat["uniLl"]:
-        individualLower = lower.upper() + lowerHelper
-        lowerwsv = WordSiv(glyphs=individualLower, seed=wordsivSeed)
+    lowerwsv = _get_wsv()
+    lowerInitialsUpper = tuple(lower.upper() for lower in cat["uniLl"])
+    for individualLower in _initial_glyph_sets(lowerInitialsUpper, lowerHelper):
+        lowerwsv.seed(wordsivSeed)
         lowerList = lowerwsv.words(
-            vocab="en", case="cap", n_words=4, min_wl=5, max_wl=14
+            glyphs=individualLower,
+            vocab="en",
+            case="cap",
+            n_words=4,
+            min_wl=5,
+            max_wl=14,
         )
-        lowerInitialsString = " ".join(str(elem) for elem in (lowerList or []))
+        lowerInitialsString = " ".join(map(str, lowerList or []))
         lowerInitials.append(lowerInitialsString.lower() + " ")
 
     lowerInitials_str = "".join(lowerInitials)
@@ -879,12 +1044,19 @@ def _generate_lowercase_text(cat, para, fullCharacterSet, characterSet):
         min_wl=1,
         max_wl=14,
     )
-    return lowerInitials_str + " ".join(str(elem) for elem in wsvtext)
+    return lowerInitials_str + " ".join(map(str, wsvtext))
 
 
-def _generate_arabic_farsi_text(
-    characterSet, para, bigProof, lang, cat, fullCharacterSet
-):
+# Words generated per positional form, indexed by ProofKind; large proofs
+# have room for fewer
+_ARABIC_WORDS_PER_FORM = (6, 6, 4)
+
+# WordSiv keyword placing a character in each positional form; other forms
+# fall back to "contains"
+_POS_FORM_KWARGS = {"init": "startswith", "medi": "inner", "fina": "endswith"}
+
+
+def _generate_arabic_farsi_text(characterSet, para, kind, lang, cat, fullCharacterSet):
     """Generate Arabic/Farsi text using WordSiv with contextual forms."""
     textProofString = ""
 
@@ -894,73 +1066,40 @@ def _generate_arabic_farsi_text(
     try:
         # Use fullCharacterSet as glyphs if available, otherwise fall back to characterSet
         glyphs = fullCharacterSet
-        wsv = WordSiv(glyphs=glyphs, vocab=vocab, seed=wordsivSeed)
+        wsv = _get_wsv(glyphs, vocab)
+        wsv.seed(wordsivSeed)
 
         # Determine number of words based on proof type
-        numberOfWords = 4 if bigProof else 6
+        numberOfWords = _ARABIC_WORDS_PER_FORM[kind]
 
         # Generate contextual form proofs for each character
-        arabWords = ""
+        arabWords = []
+        append = arabWords.append
         for g in characterSet:
-            arabWords += g + ". "
+            append(g + ". ")
 
             # Generate words with different positional forms
             for p in posForms:
+                # Position the character within words to get its contextual form
+                position = {_POS_FORM_KWARGS.get(p, "contains"): g}
                 try:
-                    # Generate words containing the character in specific position
-                    if p == "init":
-                        # Use startswith for initial form
-                        arabList = wsv.words(
-                            n_words=numberOfWords,
-                            min_wl=5,
-                            max_wl=14,
-                            startswith=g,
-                        )
-                    elif p == "medi":
-                        # Use inner for medial form
-                        arabList = wsv.words(
-                            n_words=numberOfWords,
-                            min_wl=5,
-                            max_wl=14,
-                            inner=g,
-                        )
-                    elif p == "fina":
-                        # Use endswith for final form
-                        arabList = wsv.words(
-                            n_words=numberOfWords,
-                            min_wl=5,
-                            max_wl=14,
-                            endswith=g,
-                        )
-                    else:
-                        # Fallback to contains if position not recognized
-                        arabList = wsv.words(
-                            n_words=numberOfWords,
-                            min_wl=5,
-                            max_wl=14,
-                            contains=g,
-                        )
-
-                    if arabList:
-                        arabString = " ".join([str(elem) for elem in arabList])
-                        arabWords += arabString + " "
-                except Exception as e:
+                    arabList = wsv.words(
+                        n_words=numberOfWords, min_wl=5, max_wl=14, **position
+                    )
+                except Exception:
                     # Fallback to simple word generation if positional forms fail
                     try:
                         arabList = wsv.words(
-                            n_words=numberOfWords,
-                            min_wl=5,
-                            max_wl=14,
-                            contains=g,
+                            n_words=numberOfWords, min_wl=5, max_wl=14, contains=g
                         )
-                        if arabList:
-                            arabString = " ".join([str(elem) for elem in arabList])
-                            arabWords += arabString + " "
-                    except:
-                        pass
-            arabWords += "\n"
+                    except Exception:
+                        arabList = None
 
-        textProofString = arabWords
+                if arabList:
+                    append(" ".join(map(str, arabList)) + " ")
+            append("\n")
+
+        textProofString = "".join(arabWords)
 
     except Exception as e:
         print(f"Error generating {lang} text: {e}")
@@ -970,27 +1109,48 @@ def _generate_arabic_farsi_text(
     return textProofString
 
 
-def generateSpacingString(characterSet):
+def _spacing_template(control1, control2):
+    """Spacing line around a "\x00" placeholder for the proofed character."""
+    c = "\x00"
+    return (
+        f"{control1 * 3}{c}{control1}{control2}{control1}{c}{control2}{c}{control2 * 3}"
+    )
+
+
+# Spacing line templates by Unicode category; other categories use H/O
+_SPACING_TEMPLATES = {
+    "Ll": _spacing_template("n", "o"),
+    "Nd": _spacing_template("0", "1"),
+}
+_SPACING_TEMPLATE_OTHER = _spacing_template("H", "O")
+
+
+@lru_cache(maxsize=4096)
+def _spacing_line(char):
+    """Spacing line for char, picked by its Unicode category once per char."""
+    template = _SPACING_TEMPLATES.get(
+        unicodedata.category(char), _SPACING_TEMPLATE_OTHER
+    )
+    return template.replace("\x00", char)
+
+
+def generateSpacingString(characterSet, indFont=None):
     """Create the spacing proof string efficiently using list accumulation."""
     lines = []
     append = lines.append
+    if indFont is None:
+        fontContainsCharacters = db.fontContainsCharacters
+    else:
+        # Answer coverage from the font's cached charset rather than switching
+        # DrawBot's current font to ask it
+        fontContainsCharacters = frozenset(get_font_meta(indFont)[0]).__contains__
+
     for char in characterSet:
-        if useFontContainsCharacters and not db.fontContainsCharacters(char):
+        if useFontContainsCharacters and not fontContainsCharacters(char):
             continue
         if char in ("\n", " "):
             continue
-
-        cat = unicodedata.category(char)
-        if cat == "Ll":
-            control1, control2 = "n", "o"
-        elif cat == "Nd":
-            control1, control2 = "0", "1"
-        else:
-            control1, control2 = "H", "O"
-
-        append(
-            f"{control1}{control1}{control1}{char}{control1}{control2}{control1}{char}{control2}{char}{control2}{control2}{control2}"
-        )
+        append(_spacing_line(char))
     return "\n".join(lines) + ("\n" if lines else "")
 
 
@@ -1044,6 +1204,16 @@ def charsetProof(
         traceback.print_exc()
 
 
+@lru_cache(maxsize=32)
+def _cached_spacing_string(characterSet, indFont):
+    """Spacing proof string for a character set and font, built once."""
+    return generateSpacingString(characterSet, indFont)
+
+
+# Cached spacing strings depend on glyph coverage, which fonts may reload
+register_font_cache_listener(_cached_spacing_string.cache_clear)
+
+
 def spacingProof(
     characterSet: str,
     axesProduct: list,
@@ -1067,7 +1237,7 @@ def spacingProof(
     proof_columns = columns if columns is not None else 2
 
     # Precompute spacing input and used features
-    spacingStringInput = generateSpacingString(characterSet)
+    spacingStringInput = _cached_spacing_string(characterSet, indFont)
     used_features = dict(liga=False, kern=False) if otFea is None else otFea
 
     _render_proof_content(
@@ -1112,56 +1282,63 @@ def textProof(
     # Set default textSize if None
     if textSize is None:
         textSize = get_proof_default_font_size("text_proof")
+    kind = ProofKind.for_size(textSize)
 
-    textStringInput = ""
+    textParts = []
+    append = textParts.append
 
     if accents and pte:
         # Generate accented text samples
+        accentedDict = pte.accentedDict
+        sample = random.sample
+        # Words are usable when the font covers every letter in them
+        # Fall back to the proofed characters when no full set was given
+        available_glyphs = frozenset((fullCharacterSet or characterSet or "").lower())
         for a in characterSet:
             accentList = []
-            if a.lower() in pte.accentedDict:
-                available = []
-                for s in pte.accentedDict[a.lower()]:
-                    if all(x in fullCharacterSet.lower() for x in s):
-                        available.append(s)
+            words = accentedDict.get(a.lower())
+            if words is not None:
+                available = [s for s in words if available_glyphs.issuperset(s)]
                 if len(available) < accents:
                     count = len(available)
                 else:
                     count = accents
-                textStringInput += " |" + a + "| "
-                accentList = random.sample(available, k=count)
+                append(" |" + a + "| ")
+                accentList = sample(available, k=count)
                 for w in accentList:
                     if a.isupper():
-                        textStringInput += w.replace("ß", "ẞ").upper() + " "
+                        append(w.replace("ß", "ẞ").upper() + " ")
                     else:
-                        textStringInput += w + " "
-                if textSize == get_proof_default_font_size("small_text_proof"):
-                    textStringInput += "\n"
+                        append(w + " ")
+                # Small text proofs put each letter's samples on their own line
+                if kind is ProofKind.SMALL:
+                    append("\n")
     elif not injectText:
-        # Determine if this is a big or small proof based on font size
-        bigProof = textSize == get_proof_default_font_size("large_text_proof")
-        textStringInput = generateTextProofString(
-            characterSet,
-            para,
-            casing,
-            bigProof=bigProof,
-            forceWordsiv=forceWordsiv,
-            cat=cat,
-            fullCharacterSet=fullCharacterSet,
-            lang=lang,
-            hoeflerStyle=hoeflerStyle,
+        append(
+            generateTextProofString(
+                characterSet,
+                para,
+                casing,
+                kind=kind,
+                forceWordsiv=forceWordsiv,
+                cat=cat,
+                fullCharacterSet=fullCharacterSet,
+                lang=lang,
+                hoeflerStyle=hoeflerStyle,
+            )
         )
     elif injectText:
         # Accept either an iterable of strings (list/tuple) or a single string.
         # Previously, iterating over a single injected string produced one-character-per-line output.
         if isinstance(injectText, (list, tuple)):
-            for t in injectText:
-                if not t:
-                    continue
-                textStringInput += t.rstrip() + "\n"
+            lines = [t.rstrip() for t in injectText if t]
+            if lines:
+                append("\n".join(lines) + "\n")
         else:
             # Single block of text
-            textStringInput += str(injectText).rstrip() + "\n"
+            append(str(injectText).rstrip() + "\n")
+
+    textStringInput = "".join(textParts)
 
     # Use rtl direction for Arabic/Farsi text
     text_direction = "rtl" if lang in ["ar", "fa"] else "ltr"
@@ -1185,24 +1362,28 @@ def textProof(
 
 def generateArabicContextualFormsProof(cat):
     """Generate ARA Character Set proof showing each character in all its forms."""
-    contextualProof = ""
+    contextualProof = []
+    append = contextualProof.append
 
     # Get Arabic characters
     arabic_chars = cat.get("arabTyped", "")
     if not arabic_chars:
         return ""
 
+    dual_join = frozenset(cat.get("arfaDualJoin") or "")
+    right_join = frozenset(cat.get("arfaRightJoin") or "")
+
     for char in arabic_chars:
         if char == "ء":  # Hamza special case
-            contextualProof += char + " "
-        elif char in cat.get("arfaDualJoin", ""):
+            append(char + " ")
+        elif char in dual_join:
             # Show character: isolated, then connected forms
-            contextualProof += char + " " + char + char + char + " "
-        elif char in cat.get("arfaRightJoin", ""):
+            append(char + " " + char + char + char + " ")
+        elif char in right_join:
             # Show character with connecting letter
-            contextualProof += char + " " + "ب" + char + " "
+            append(char + " " + "ب" + char + " ")
 
-    return contextualProof
+    return "".join(contextualProof)
 
 
 def arabicContextualFormsProof(
@@ -1268,6 +1449,18 @@ class ProofContext:
     proof_name: str | None
 
 
+class ProofParams(NamedTuple):
+    """Common per-proof parameters shared by the proof handlers."""
+
+    font_size: int | float
+    columns: int
+    paragraphs: int
+    section_name: str
+    tracking_value: int | float
+    align_value: str
+    otfeatures: dict
+
+
 class BaseProofHandler(ABC):
     """Base class for all proof type handlers."""
 
@@ -1276,33 +1469,35 @@ class BaseProofHandler(ABC):
         self.proof_settings = proof_settings
         self.get_proof_font_size = get_proof_font_size_func
         self.unique_proof_key = create_unique_proof_key(proof_name)
+        self.settings_generation = _settings_generation
+
+    # Commonly accessed settings are computed once per handler use;
+    # reset_cached_settings() drops them when the settings change
+    _CACHED_SETTINGS = ("font_size", "tracking_value", "align_value")
+
+    def reset_cached_settings(self):
+        """Forget cached font size, tracking and alignment values."""
+        for name in self._CACHED_SETTINGS:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def font_size(self):
+        """Font size for this proof."""
+        return self.get_proof_font_size(self.proof_name)
+
+    @cached_property
+    def tracking_value(self):
+        """Tracking value for this proof."""
+        return self.proof_settings.get(
+            make_settings_key(self.unique_proof_key, "tracking"), 0
+        )
 
-        # Cache commonly accessed settings for performance
-        self._cached_font_size = None
-        self._cached_tracking = None
-        self._cached_align = None
-
-    def get_font_size(self):
-        """Get font size for this proof."""
-        if self._cached_font_size is None:
-            self._cached_font_size = self.get_proof_font_size(self.proof_name)
-        return self._cached_font_size
-
-    def get_tracking_value(self):
-        """Get tracking value for this proof."""
-        if self._cached_tracking is None:
-            self._cached_tracking = self.proof_settings.get(
-                make_settings_key(self.unique_proof_key, "tracking"), 0
-            )
-        return self._cached_tracking
-
-    def get_align_value(self):
-        """Get alignment value for this proof."""
-        if self._cached_align is None:
-            self._cached_align = self.proof_settings.get(
-                make_settings_key(self.unique_proof_key, "align"), "left"
-            )
-        return self._cached_align
+    @cached_property
+    def align_value(self):
+        """Alignment value for this proof."""
+        return self.proof_settings.get(
+            make_settings_key(self.unique_proof_key, "align"), "left"
+        )
 
     def get_section_name(self, font_size):
         """Get section name for this proof."""
@@ -1310,17 +1505,18 @@ class BaseProofHandler(ABC):
 
     def get_common_proof_params(self, context, default_columns=2, default_paragraphs=5):
         """Extract common proof parameters to reduce code duplication."""
-        return {
-            "font_size": self.get_font_size(),
-            "columns": context.cols_by_proof.get(context.proof_name, default_columns),
-            "paragraphs": context.paras_by_proof.get(
+        font_size = self.font_size
+        return ProofParams(
+            font_size=font_size,
+            columns=context.cols_by_proof.get(context.proof_name, default_columns),
+            paragraphs=context.paras_by_proof.get(
                 context.proof_name, default_paragraphs
             ),
-            "section_name": self.get_section_name(self.get_font_size()),
-            "tracking_value": self.get_tracking_value(),
-            "align_value": self.get_align_value(),
-            "otfeatures": context.otfeatures_by_proof.get(context.proof_name, {}),
-        }
+            section_name=self.get_section_name(font_size),
+            tracking_value=self.tracking_value,
+            align_value=self.align_value,
+            otfeatures=context.otfeatures_by_proof.get(context.proof_name, {}),
+        )
 
     @abstractmethod
     def generate_proof(self, context):
@@ -1354,21 +1550,21 @@ class BaseProofHandler(ABC):
             context.axes_product,
             context.ind_font,
             context.paired_static_styles if mixed_styles else None,
-            params["columns"],
-            params["paragraphs"],
+            params.columns,
+            params.paragraphs,
             False,  # casing
-            params["font_size"],
-            params["section_name"],
+            params.font_size,
+            params.section_name,
             mixed_styles,
             force_wordsiv,
             inject_text,
-            params["otfeatures"],
+            params.otfeatures,
             accents,
             context.cat,
             context.full_character_set,
             language,
-            params["tracking_value"],
-            params["align_value"],
+            params.tracking_value,
+            params.align_value,
             hoeflerStyle=hoefler_style,
         )
 
@@ -1376,7 +1572,7 @@ class BaseProofHandler(ABC):
 class StandardTextProofHandler(BaseProofHandler):
     """Standard handler for text-based proofs with configurable parameters."""
 
-    # Configuration mapping is provided via proof_config.get_text_proof_config
+    # Configuration mapping is provided via config.TEXT_PROOF_CONFIGS
 
     def __init__(
         self, proof_name, proof_settings, get_proof_font_size_func, proof_key=None
@@ -1469,8 +1665,6 @@ class CategoryBasedProofHandler(BaseProofHandler):
 
     def get_proof_sections(self, context):
         """Get proof sections based on user settings."""
-        from fonts import get_charset_proof_categories
-
         categories = get_charset_proof_categories(context.cat)
         proof_sections = []
 
@@ -1494,7 +1688,7 @@ class FilteredCharacterSetHandler(CategoryBasedProofHandler):
     """Handler for Filtered Character Set proof type."""
 
     def generate_proof(self, context):
-        font_size = self.get_font_size()
+        font_size = self.font_size
         tracking_value = font_size / 1.5
         otfeatures = context.otfeatures_by_proof.get(context.proof_name, {})
 
@@ -1518,21 +1712,21 @@ class SpacingProofHandler(CategoryBasedProofHandler):
 
     def generate_proof(self, context):
         params = self.get_common_proof_params(context, default_columns=2)
-        otfeatures = params["otfeatures"]
+        otfeatures = params.otfeatures
 
         for section_label, character_set in self.get_proof_sections(context):
             if character_set:  # Only generate if characters exist
-                section_name = f"Spacing - {section_label} - {params['font_size']}pt"
+                section_name = f"Spacing - {section_label} - {params.font_size}pt"
                 spacingProof(
                     character_set,
                     context.axes_product,
                     context.ind_font,
                     None,  # pairedStaticStyles
                     otfeatures,
-                    params["font_size"],
-                    params["columns"],
+                    params.font_size,
+                    params.columns,
                     sectionName=section_name,
-                    tracking=params["tracking_value"],
+                    tracking=params.tracking_value,
                 )
 
 
@@ -1540,9 +1734,9 @@ class ArCharacterSetHandler(BaseProofHandler):
     """Handler for Arabic Character Set proof type."""
 
     def generate_proof(self, context):
-        font_size = self.get_font_size()
+        font_size = self.font_size
         section_name = self.get_section_name(font_size)
-        tracking_value = self.get_tracking_value()
+        tracking_value = self.tracking_value
 
         arabicContextualFormsProof(
             context.cat,
@@ -1570,8 +1764,17 @@ PROOF_HANDLER_REGISTRY = {
 }
 
 
-# Handler cache for performance optimization
-_handler_cache = {}
+# Handler cache for performance optimization, least recently used first
+_handler_cache = collections.OrderedDict()
+# Handlers kept before the least recently used one is dropped
+_MAX_CACHED_HANDLERS = 64
+
+
+def _cache_handler(cache_key, handler):
+    """Store a handler, evicting the least recently used beyond the cap."""
+    _handler_cache[cache_key] = handler
+    while len(_handler_cache) > _MAX_CACHED_HANDLERS:
+        _handler_cache.popitem(last=False)
 
 
 def get_proof_handler(proof_type, proof_name, proof_settings, get_proof_font_size_func):
@@ -1586,17 +1789,24 @@ def get_proof_handler(proof_type, proof_name, proof_settings, get_proof_font_siz
     Returns:
         Instance of the appropriate proof handler, or None if not found
     """
-    # Create cache key based on proof type and name
-    cache_key = f"{proof_type}::{proof_name}"
+    # Cache key based on proof type and name
+    cache_key = (proof_type, proof_name)
 
     # Check cache first
     if cache_key in _handler_cache:
-        # Update settings in cached handler (they may have changed)
+        # Reuse the cached handler, refreshing settings only when stale
         cached_handler = _handler_cache[cache_key]
-        cached_handler.proof_settings = proof_settings
-        cached_handler._cached_tracking = None  # Reset cache
-        cached_handler._cached_align = None
-        cached_handler._cached_font_size = None
+        _handler_cache.move_to_end(cache_key)
+        # The settings dict is edited in place, so identity alone cannot tell
+        # whether it changed; the generation covers in-place edits
+        if (
+            cached_handler.proof_settings is not proof_settings
+            or cached_handler.settings_generation != _settings_generation
+        ):
+            cached_handler.proof_settings = proof_settings
+            cached_handler.get_proof_font_size = get_proof_font_size_func
+            cached_handler.settings_generation = _settings_generation
+            cached_handler.reset_cached_settings()
         return cached_handler
 
     # Check if this is a special handler in the registry
@@ -1606,34 +1816,29 @@ def get_proof_handler(proof_type, proof_name, proof_settings, get_proof_font_siz
             handler = handler_class(
                 proof_name, proof_settings, get_proof_font_size_func
             )
-            _handler_cache[cache_key] = handler
+            _cache_handler(cache_key, handler)
             return handler
         except Exception as e:
-            print(f"Error creating handler for '{proof_type}': {e}")
+            log_error(e, context=f"creating handler for '{proof_type}'")
             return None
 
     # For text-based proofs, use StandardTextProofHandler with configuration
-    from config import PROOF_REGISTRY
-
-    # Find the proof key by looking up the display name in the registry
-    proof_key = None
-    for key, proof_info in PROOF_REGISTRY.items():
-        if proof_info["display_name"] == proof_type:
-            proof_key = key
-            break
+    proof_key = PROOF_NAME_TO_KEY.get(proof_type)
 
     if proof_key:
         try:
             handler = StandardTextProofHandler(
                 proof_name, proof_settings, get_proof_font_size_func, proof_key
             )
-            _handler_cache[cache_key] = handler
+            _cache_handler(cache_key, handler)
             return handler
         except Exception as e:
-            print(f"Error creating StandardTextProofHandler for '{proof_type}': {e}")
+            log_error(
+                e, context=f"creating StandardTextProofHandler for '{proof_type}'"
+            )
             return None
 
-    print(f"No handler found for proof type: {proof_type}")
+    log_error(f"No handler found for proof type: {proof_type}")
     return None
 
 
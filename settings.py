@@ -208,7 +208,7 @@ def validate_setting_value(key, value):
         tuple: (is_valid, converted_value, error_message)
     """
     try:
-        if "_tracking" in key:
+        if key.endswith("_tracking"):
             # Tracking values can be float (including negative)
             converted_value = float(value)
             return True, converted_value, None
@@ -288,6 +288,7 @@ from config import (
     get_default_alignment_for_proof,
     get_proof_display_names,
     get_otf_prefix,
+    resolve_base_proof_key,
 )
 
 
@@ -296,6 +297,7 @@ from config import (
 # =============================================================================
 
 
+@lru_cache(maxsize=512)
 def create_unique_proof_key(proof_name):
     """Create a unique key from proof name for settings storage."""
     unique_proof_key = (
@@ -324,6 +326,30 @@ def make_settings_key(base_key, setting_type, category=None):
     return f"{base_key}_{setting_type}"
 
 
+def make_proof_keys(base_key):
+    """Construct every per-proof settings key in one call.
+
+    Args:
+        base_key: The proof key or unique proof key
+
+    Returns:
+        tuple: (font_size_key, cols_key, para_key, tracking_key, align_key, otf_prefix)
+
+    Example:
+        make_proof_keys("basic_paragraph_small")[1] -> "basic_paragraph_small_cols"
+    """
+    prefix = f"{base_key}_"
+    return (
+        prefix + "fontSize",
+        prefix + "cols",
+        prefix + "para",
+        prefix + "tracking",
+        prefix + "align",
+        get_otf_prefix(base_key),
+    )
+
+
+@lru_cache(maxsize=4096)
 def make_feature_key(base_key, feature_tag):
     """Construct a consistent OpenType feature settings key.
 
@@ -572,6 +598,14 @@ class Settings:
         self._ensure_nested_structure("proof_options", {})
         self._set_nested_value(f"proof_options.{option_key}", value)
 
+    def update_proof_options(self, options, auto_save=True):
+        """Set several proof option values at once with a single save."""
+        self._ensure_nested_structure("proof_options", {})
+        self.data["proof_options"].update(options)
+
+        if auto_save:
+            self.save()
+
     def get_proof_order(self):
         """Get the current proof order."""
         return self.data.get(
@@ -624,11 +658,13 @@ class Settings:
         )
         self._set_nested_value("pdf_output.custom_location", location, auto_save=False)
 
-    def reset_to_defaults(self):
+    def reset_to_defaults(self, auto_save=True):
         """Reset all settings to default values."""
         self.data = self._get_defaults()
         self.user_settings_file = None
-        self.save()
+
+        if auto_save:
+            self.save()
 
     def load_from_file(self, file_path):
         """Load settings from a specific file."""
@@ -763,29 +799,32 @@ class ProofSettingsManager:
 
     def _get_proof_key_for_identifier(self, proof_identifier):
         """Get proof key and font size key for a given proof identifier."""
-        display_name_to_settings_key = get_proof_settings_mapping()
+        display_name, settings_key = resolve_base_proof_key(proof_identifier)
 
-        if proof_identifier in display_name_to_settings_key:
+        if display_name == proof_identifier:
             # Direct match
-            proof_key = display_name_to_settings_key[proof_identifier]
-            return proof_key, make_settings_key(proof_key, "fontSize")
+            return settings_key, make_settings_key(settings_key, "fontSize")
 
-        # Check for numbered variants
-        for display_name, settings_key in display_name_to_settings_key.items():
-            if proof_identifier.startswith(display_name):
-                unique_key = create_unique_proof_key(proof_identifier)
-                return settings_key, make_settings_key(unique_key, "fontSize")
+        if settings_key:
+            # Numbered variant
+            unique_key = create_unique_proof_key(proof_identifier)
+            return settings_key, make_settings_key(unique_key, "fontSize")
 
         # Fallback
         proof_key = "basic_paragraph_small"
         unique_key = create_unique_proof_key(proof_identifier)
         return proof_key, make_settings_key(unique_key, "fontSize")
 
-    def get_proof_font_size(self, proof_identifier):
-        """Get font size for a specific proof from its settings."""
+    def get_proof_font_size(self, proof_identifier, proof_settings=None):
+        """Get font size for a specific proof from its settings.
+
+        proof_settings overrides the live settings, e.g. with a render snapshot.
+        """
         proof_key, font_size_key = self._get_proof_key_for_identifier(proof_identifier)
         default_font_size = get_proof_default_font_size(proof_key)
-        return self.proof_settings.get(font_size_key, default_font_size)
+        if proof_settings is None:
+            proof_settings = self.proof_settings
+        return proof_settings.get(font_size_key, default_font_size)
 
     def _init_proof_instance_settings(self, unique_key, base_proof_key, proof_info):
         """Initialize settings for a specific proof instance using consolidated logic."""
@@ -858,9 +897,7 @@ class ProofSettingsManager:
 
     def _build_settings_for_proof(self, proof_name, unique_key, settings_key):
         """Build settings data for a single proof."""
-        cols_key = make_settings_key(unique_key, "cols")
-        para_key = make_settings_key(unique_key, "para")
-        otf_prefix = get_otf_prefix(unique_key)
+        _, cols_key, para_key, _, _, otf_prefix = make_proof_keys(unique_key)
 
         result = {"cols": None, "paras": None, "otf": {}}
 
@@ -920,48 +957,47 @@ class ProofSettingsManager:
 
     def _build_numeric_settings_list(self, settings_key, lookup_key=None):
         """Build list of numeric settings for a proof using consolidated logic."""
-        items = []
         lookup_key = lookup_key or settings_key
-        storage_proof = get_proof_by_storage_key(lookup_key)
-        settings_proof = get_proof_by_settings_key(lookup_key)
+        # Storage and settings keys resolve to the same registry entry
+        proof_info = get_proof_by_settings_key(lookup_key)
+        font_size_key, cols_key, para_key, tracking_key, _, _ = make_proof_keys(
+            settings_key
+        )
 
         # Define setting configurations with their display names and conditions
         setting_configs = [
             (
                 "Font Size",
-                "fontSize",
+                font_size_key,
                 True,
-                lambda: get_proof_default_font_size(lookup_key),
+                get_proof_default_font_size(lookup_key),
             ),
             (
                 "Columns",
-                "cols",
+                cols_key,
                 lookup_key not in self._COLUMN_EXCLUDED_PROOFS,
-                lambda: storage_proof["default_cols"] if storage_proof else 2,
+                proof_info["default_cols"] if proof_info else 2,
             ),
             (
                 "Paragraphs",
-                "para",
-                settings_proof and settings_proof.get("has_paragraphs", False),
-                lambda: 5,
+                para_key,
+                proof_info and proof_info.get("has_paragraphs", False),
+                5,
             ),
-            ("Tracking", "tracking", proof_supports_formatting(lookup_key), lambda: 0),
+            ("Tracking", tracking_key, proof_supports_formatting(lookup_key), 0),
         ]
 
-        for display_name, setting_type, condition, default_func in setting_configs:
-            if condition:
-                setting_key = make_settings_key(settings_key, setting_type)
-                default_value = default_func()
-                current_value = self.proof_settings.get(setting_key, default_value)
-                items.append(
-                    {
-                        "Setting": display_name,
-                        "Value": current_value,
-                        "_key": setting_key,
-                    }
-                )
-
-        return items
+        # Build the rows in one pass, with a single dict per shown setting
+        proof_settings = self.proof_settings
+        return [
+            {
+                "Setting": display_name,
+                "Value": proof_settings.get(setting_key, default_value),
+                "_key": setting_key,
+            }
+            for display_name, setting_key, condition, default_value in setting_configs
+            if condition
+        ]
 
     def get_popover_settings_for_proof(self, proof_key):
         """Get settings data for popover display for a specific proof type."""
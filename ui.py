@@ -377,6 +377,33 @@ class StepperTarget(AppKit.NSObject):
             self.callback(sender)
 
 
+class DeferredCallTarget(AppKit.NSObject):
+    """Run the latest scheduled callable once on the next run loop pass."""
+
+    def init(self):
+        """Initialize with nothing pending."""
+        self = objc.super(DeferredCallTarget, self).init()
+        if self is None:
+            return None
+        self.pending = None
+        return self
+
+    @objc.python_method
+    def schedule(self, func):
+        """Schedule func, replacing any call that has not run yet."""
+        self.pending = func
+        AppKit.NSObject.cancelPreviousPerformRequestsWithTarget_selector_object_(
+            self, "runPending:", None
+        )
+        self.performSelector_withObject_afterDelay_("runPending:", None, 0.0)
+
+    def runPending_(self, sender):
+        """Run the pending callable, if any."""
+        func, self.pending = self.pending, None
+        if func is not None:
+            func()
+
+
 class StepperList2Cell(vanilla.Group):
     """
     A cell that displays a text field with a stepper control for numeric values.
@@ -982,6 +1009,8 @@ class FilesTab:
 
     def add_fonts(self, paths):
         """Add fonts to the font manager."""
+        if self.parent_window.block_while_generating("adding fonts"):
+            return
         try:
             from settings import validate_font_path
 
@@ -1005,6 +1034,8 @@ class FilesTab:
 
     def removeFontsCallback(self, sender):
         """Handle the Remove Selected button click."""
+        if self.parent_window.block_while_generating("removing fonts"):
+            return
         try:
             # Try primary API
             try:
@@ -1055,6 +1086,8 @@ class FilesTab:
 
     def performDropCallback(self, info):
         """Handle both file drops and internal reordering."""
+        if self.parent_window.block_while_generating("changing fonts"):
+            return False
         sender = info["sender"]
         source = info["source"]
         index = info["index"]
@@ -1212,6 +1245,8 @@ class FilesTab:
 
     def deleteFontCallback(self, sender):
         """Handle font deletion from the table."""
+        if self.parent_window.block_while_generating("removing fonts"):
+            return
         selection = sender.getSelection()
         if not selection:
             return
@@ -1689,11 +1724,8 @@ class ControlsTab:
 
     def show_popover_for_option(self, option, row_index):
         """Show popover for the specified option."""
-        # Import the helper function from proof_config
-        from config import get_proof_settings_mapping
-
-        # Get proof name to key mapping from registry
-        proof_name_to_key = get_proof_settings_mapping()
+        # Proof name to key mapping from registry (shared, read-only)
+        from config import PROOF_NAME_TO_KEY as proof_name_to_key
 
         # Check if this is a base proof type or a numbered variant
         base_proof_type = option
@@ -1714,7 +1746,7 @@ class ControlsTab:
             )
 
             # Create and show popover
-            if not hasattr(self.parent_window, "proof_settings_popover"):
+            if self.parent_window.proof_settings_popover is None:
                 self.parent_window.create_proof_settings_popover()
 
             # Update popover with settings for this specific proof instance
@@ -1731,7 +1763,7 @@ class ControlsTab:
 
     def hide_popover_for_option(self, option):
         """Hide popover for the specified option."""
-        if hasattr(self.parent_window, "proof_settings_popover"):
+        if self.parent_window.proof_settings_popover is not None:
             self.parent_window.proof_settings_popover.close()
 
     def addProofCallback(self, sender):